@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+ChromeLauncherConfig.load on a synthetic cfg: old regex if/elif chain vs table dispatch
+
+    python bench/bench_config_load.py [--lines 50000] [--repeat 5]
+
+About 80% of the generated lines are USAGE_ entries, as in a cfg that
+has been in use for a long time; the rest are PER_URL_, CUSTOM_URL_,
+scalar keys and a few malformed lines.
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import re
+import tempfile
+import time
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'chrome_launcher_ui_v2.2.py')
+
+COMPARED = [
+    'url_choice', 'last_email', 'channel', 'window_x', 'window_y', 'window_w', 'window_h',
+    'favorites', 'recents', 'use_perurl', 'theme', 'custom_chrome', 'auto_update_check',
+    'last_update_check', 'per_url', 'usage', 'custom_urls', 'search_history', 'quick_launch_profiles',
+]
+
+
+def load_launcher():
+    spec = importlib.util.spec_from_file_location('chrome_launcher_ui', LAUNCHER)
+    launcher = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(launcher)
+    return launcher
+
+
+def regex_chain_load(config, path: str):
+    """ChromeLauncherConfig.load before the table-driven parser"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+
+            if match := re.match(r'URL_CHOICE=(\d)', line):
+                config.url_choice = match.group(1)
+            elif match := re.match(r'LAST_EMAIL=(.+)', line):
+                config.last_email = match.group(1).strip()
+            elif match := re.match(r'CHANNEL=(.+)', line):
+                config.channel = match.group(1).strip()
+            elif match := re.match(r'WINDOW_X=(.+)', line):
+                config.window_x = match.group(1).strip()
+            elif match := re.match(r'WINDOW_Y=(.+)', line):
+                config.window_y = match.group(1).strip()
+            elif match := re.match(r'WINDOW_W=(.+)', line):
+                config.window_w = match.group(1).strip()
+            elif match := re.match(r'WINDOW_H=(.+)', line):
+                config.window_h = match.group(1).strip()
+            elif match := re.match(r'FAVORITES=(.*)', line):
+                config.favorites = [f for f in match.group(1).split(',') if '@' in f]
+            elif match := re.match(r'RECENTS=(.*)', line):
+                config.recents = [r for r in match.group(1).split(',') if '@' in r]
+            elif match := re.match(r'USE_PERURL=(\d)', line):
+                config.use_perurl = match.group(1)
+            elif match := re.match(r'THEME=(.+)', line):
+                config.theme = match.group(1).strip()
+            elif match := re.match(r'CUSTOM_CHROME=(.*)', line):
+                config.custom_chrome = match.group(1).strip()
+            elif match := re.match(r'AUTO_UPDATE_CHECK=(\d)', line):
+                config.auto_update_check = match.group(1)
+            elif match := re.match(r'LAST_UPDATE_CHECK=(.+)', line):
+                config.last_update_check = match.group(1).strip()
+            elif match := re.match(r'PER_URL_(.+?)=(.+)', line):
+                config.per_url[match.group(1)] = match.group(2)
+            elif match := re.match(r'USAGE_(.+?)=(\d+)', line):
+                config.usage[match.group(1)] = int(match.group(2))
+            elif match := re.match(r'CUSTOM_URL_(.+?)=(.+)', line):
+                config.custom_urls[match.group(1)] = match.group(2)
+            elif match := re.match(r'SEARCH_HISTORY=(.*)', line):
+                config.search_history = [h for h in match.group(1).split('|') if h]
+            elif match := re.match(r'QUICK_LAUNCH=(.*)', line):
+                config.quick_launch_profiles = [p for p in match.group(1).split(',') if '@' in p]
+
+
+def write_cfg(path: str, lines: int):
+    rng = random.Random(1)
+    out = [
+        'URL_CHOICE=2', 'LAST_EMAIL=user00001@gmail.com', 'CHANNEL=Beta', 'WINDOW_X=10',
+        'WINDOW_Y=20', 'WINDOW_W=900', 'WINDOW_H=700', 'USE_PERURL=1', 'THEME=Light',
+        'CUSTOM_CHROME=', 'AUTO_UPDATE_CHECK=1', 'LAST_UPDATE_CHECK=2024-01-01T00:00:00',
+        'FAVORITES=user00001@gmail.com,user00002@gmail.com',
+        'RECENTS=user00003@gmail.com,not-an-email',
+        'SEARCH_HISTORY=12|abc||user', 'QUICK_LAUNCH=user00001@gmail.com',
+        'URL_CHOICE=', 'USAGE_broken=abc', 'garbage line', 'PER_URL_x=',
+    ]
+    while len(out) < lines:
+        i = len(out)
+        roll = rng.random()
+        if roll < 0.8:
+            out.append(f'USAGE_user{i:05d}@gmail.com={rng.randint(0, 500)}')
+        elif roll < 0.95:
+            out.append(f'PER_URL_user{i:05d}@gmail.com={rng.randint(1, 9)}')
+        else:
+            out.append(f'CUSTOM_URL_site{i}=https://example.com/{i}')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(out) + '\n')
+
+
+def best_ms(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--lines', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.cfg')
+        write_cfg(path, args.lines)
+
+        def old():
+            config = launcher.ChromeLauncherConfig(path)
+            regex_chain_load(config, path)
+            return config
+
+        def new():
+            config = launcher.ChromeLauncherConfig(path)
+            config.load()
+            return config
+
+        old_config, new_config = old(), new()
+        for attr in COMPARED:
+            assert getattr(old_config, attr) == getattr(new_config, attr), attr
+
+        old_ms = best_ms(old, args.repeat)
+        new_ms = best_ms(new, args.repeat)
+        print(f'{args.lines} lines, best of {args.repeat}: regex chain {old_ms:.1f}ms, '
+              f'table {new_ms:.1f}ms ({old_ms / new_ms:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
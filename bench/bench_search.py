@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Per-query search latency: do_search before the index (linear scans) vs EmailSearchIndex
+
+    python bench/bench_search.py [--sizes 1000,10000,100000]
+
+Both sides follow do_search's branches: regex mode, a query with '@'
+(exact email, else case-insensitive substring) and otherwise the digits
+extracted from the query. Regex mode scans the list in both versions.
+Emails are synthetic (fixed seed), shaped like real profile lists:
+a few name prefixes followed by a zero-padded account number.
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import re
+import time
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'chrome_launcher_ui_v2.2.py')
+
+NAMES = ['king.networkplus', 'shop', 'family.yt', 'netflix.acc', 'team']
+# (query, regex mode)
+QUERIES = [
+    ('12', False), ('123', False), ('0456', False), ('acc 0012', False),
+    ('plus12@', False), ('@gmail', False), (r'shop\d*12@', True),
+]
+
+
+def load_launcher():
+    spec = importlib.util.spec_from_file_location('chrome_launcher_ui', LAUNCHER)
+    launcher = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(launcher)
+    return launcher
+
+
+def make_emails(launcher, n: int):
+    rng = random.Random(1)
+    width = len(str(n * 3))
+    emails = {f'{rng.choice(NAMES)}{rng.randint(1, n * 3):0{width}d}@gmail.com' for _ in range(n * 2)}
+    return launcher.sort_emails_by_number(list(emails)[:n])
+
+
+def split_digits(key: str):
+    """do_search's normalize_digits: (digits, zero-stripped digits)"""
+    digits = ''.join(c for c in key if c.isdigit())
+    return digits, digits.lstrip('0') or '0'
+
+
+def linear_search(emails, key: str, regex: bool):
+    """do_search's matching before the index; None where it reported 'No digits found'"""
+    if regex:
+        pattern = re.compile(key)
+        return [e for e in emails if pattern.search(e)]
+    if '@' in key:
+        if key in emails:
+            return [key]
+        return [e for e in emails if key.lower() in e.lower()]
+    digits, normalized = split_digits(key)
+    if not digits:
+        return None
+    return list(set(e for e in emails if digits in e or normalized in e))
+
+
+def index_search(index, key: str, regex: bool):
+    """The same branches in the current do_search (without its result cache)"""
+    if regex:
+        pattern = re.compile(key)
+        return [e for e in index.emails if pattern.search(e)]
+    if '@' in key:
+        if key in index:
+            return [key]
+        return index.find_substring(key)
+    digits, normalized = split_digits(key)
+    if not digits:
+        return None
+    return index.find_digits(digits, normalized)
+
+
+def per_query_ms(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    for n in (int(size) for size in args.sizes.split(',')):
+        emails = make_emails(launcher, n)
+        start = time.perf_counter()
+        index = launcher.EmailSearchIndex(emails)
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f'n={n}  index build {build_ms:.1f}ms')
+
+        repeat = 200 if n < 100000 else 20
+        for key, regex in QUERIES:
+            expected = sorted(set(linear_search(emails, key, regex)))
+            hits = index_search(index, key, regex)
+            assert sorted(hits) == expected, key
+
+            linear = per_query_ms(lambda: linear_search(emails, key, regex), repeat)
+            indexed = per_query_ms(lambda: index_search(index, key, regex), repeat)
+            label = f'{key!r} (regex)' if regex else repr(key)
+            print(f'  {label:22} hits={len(hits):6}  before {linear:8.3f}ms  now {indexed:8.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
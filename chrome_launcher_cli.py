@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Chrome Profile Launcher ULTRA - command line entry point
+
+Same arguments as chrome_launcher_ui_v2.2.py. A script run directly is
+compiled from source every time; importing it through this file lets
+Python reuse the cached bytecode in __pycache__, which is most of the
+start-up cost of a single --email launch.
+"""
+
+import importlib.util
+import os
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chrome_launcher_ui_v2.2.py')
+
+spec = importlib.util.spec_from_file_location('chrome_launcher_ui', LAUNCHER)
+launcher = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(launcher)
+
+if __name__ == '__main__':
+    launcher.main()
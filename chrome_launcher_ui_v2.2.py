@@ -9,17 +9,38 @@ import sys
 import json
 import re
 import subprocess
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, Menu
 from datetime import datetime
-from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import argparse
-import urllib.request
-import urllib.error
-import hashlib
-import tempfile
+import atexit
+try:
+    import sqlite3
+except ImportError:  # Python built without sqlite
+    sqlite3 = None
 import shutil
+import socket
+import stat
+import struct
+import threading
+import time
+import queue
+from collections import OrderedDict
+from functools import lru_cache
+import bisect
+import heapq
+import zlib
+
+# Imported by _load_tk() on first GUI use, command-line launches never load tkinter
+tk = ttk = messagebox = filedialog = Menu = None
+
+
+def _load_tk():
+    """Bind tkinter and its submodules to the module globals"""
+    global tk, ttk, messagebox, filedialog, Menu
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as _ttk, messagebox as _messagebox, filedialog as _filedialog
+        tk, ttk, messagebox, filedialog, Menu = tkinter, _ttk, _messagebox, _filedialog, tkinter.Menu
 
 # Version information
 VERSION = "2.4"
@@ -29,52 +50,243 @@ UPDATE_CHECK_URL = "https://raw.githubusercontent.com/JaopaiZ/chrome-launcher/ma
 # Example: "https://raw.githubusercontent.com/JaopaiZ/chrome-launcher/main/version.json"
 DOWNLOAD_URL = "https://raw.githubusercontent.com/JaopaiZ/chrome-launcher/main/chrome_launcher_ui_v2.2.py"  
 # Example: "https://raw.githubusercontent.com/JaopaiZ/chrome-launcher/main/chrome_launcher_ui_v2.2.py"
+DOWNLOAD_TIMEOUT = 15
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILE = os.path.join(SCRIPT_DIR, 'ChromeLauncherUI.cfg')
+LOG_FILE = os.path.join(SCRIPT_DIR, 'ChromeLauncherUI.log')
 
+# URL_CHOICE -> default URL
+DEFAULT_URLS = {
+    '1': 'https://www.youtube.com/paid_memberships?ybp=mAEK',
+    '2': 'https://myaccount.google.com/family/details',
+    '3': 'https://www.netflix.com/account',
+    '4': 'https://mail.google.com/mail/u/0/?tab=rm&ogbl#inbox',
+    '5': 'https://www.apps.disneyplus.com/th/home',
+    '6': 'primevideo.com/-/th/signup',
+    # '7': 'https://media.tenor.com/QpIBfnIvRLcAAAAj/i-love-you-love.gif'
+    '7': 'https://auth.hbomax.com/login'
+}
 
+
+NUMBER_RE = re.compile(r'\d+')
+FAV_PREFIX_RE = re.compile(r'^[^\s]+\s+')
+FAV_COUNT_RE = re.compile(r'\s+\(x\d+\)\s*$')
+
+
+@lru_cache(maxsize=None)
 def extract_number_from_email(email: str) -> int:
     """Extract first number from email for sorting, return 999999 if no number"""
-    match = re.search(r'\d+', email)
+    match = NUMBER_RE.search(email)
     if match:
         return int(match.group())
     return 999999  # Emails without numbers go to the end
 
 
+def email_sort_key(email: str) -> Tuple[int, str]:
+    """Total order used by SortedEmailList: number first, then the email itself"""
+    return (extract_number_from_email(email), email)
+
+
 def sort_emails_by_number(emails: List[str]) -> List[str]:
     """Sort emails by the first number found in them (ascending)"""
     return sorted(emails, key=extract_number_from_email)
 
 
+class SortedEmailList:
+    """Profile emails kept in number order, with O(1) membership.
+    
+    Sort keys are computed once per email and kept alongside the list so
+    refreshes can bisect new emails into place instead of re-sorting.
+    """
+    
+    def __init__(self, emails: List[str] = ()):
+        self._emails: List[str] = []
+        self._keys: List[Tuple[int, str]] = []
+        self._members = set()
+        self.update(emails)
+    
+    def __iter__(self):
+        return iter(self._emails)
+    
+    def __len__(self) -> int:
+        return len(self._emails)
+    
+    def __getitem__(self, index):
+        return self._emails[index]
+    
+    def __contains__(self, email) -> bool:
+        return email in self._members
+    
+    @property
+    def members(self) -> set:
+        """Current emails as a set; replaced (never mutated) by update(), safe to read from a worker"""
+        return self._members
+    
+    def update(self, emails: List[str]) -> Tuple[List[str], List[str]]:
+        """Bring the list in line with emails, returns (added, removed)"""
+        new_members = set(emails)
+        added = [e for e in new_members if e not in self._members]
+        removed = [e for e in self._members if e not in new_members]
+        
+        if len(added) + len(removed) > len(self._emails) // 4:
+            # Large change (or first fill), one sort beats many insertions
+            self._keys = sorted(email_sort_key(e) for e in new_members)
+            self._emails = [key[1] for key in self._keys]
+        else:
+            for email in removed:
+                i = bisect.bisect_left(self._keys, email_sort_key(email))
+                del self._keys[i]
+                del self._emails[i]
+            for email in added:
+                key = email_sort_key(email)
+                i = bisect.bisect_left(self._keys, key)
+                self._keys.insert(i, key)
+                self._emails.insert(i, email)
+        
+        self._members = new_members
+        return (added, removed)
+    
+    def sort(self, emails: List[str]) -> List[str]:
+        """Order an arbitrary subset the same way as this list"""
+        return sorted(emails, key=email_sort_key)
+
+
+def private_dir(parent: str, name: str) -> str:
+    """parent/name as a directory only the current user can use.
+    
+    Created with mode 0700. An existing entry that is not a real directory
+    or belongs to another user raises PermissionError instead of being used.
+    """
+    path = os.path.join(parent, name)
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f'{path} is not a directory')
+    if hasattr(os, 'getuid'):
+        if info.st_uid != os.getuid():
+            raise PermissionError(f'{path} belongs to another user')
+        if info.st_mode & 0o077:
+            os.chmod(path, 0o700)
+    return path
+
+
+def format_progress(done: int, total: int, rate: float) -> str:
+    """Human readable download progress with ETA"""
+    if not total:
+        return f'{done // 1024} KB'
+    
+    percent = done * 100 // total
+    eta = f', ETA {int((total - done) / rate)}s' if rate and done < total else ''
+    return f'{percent}% ({done // 1024} / {total // 1024} KB{eta})'
+
+
 class AutoUpdater:
     """Handle automatic updates from remote server"""
     
-    def __init__(self, current_version: str, update_url: str, download_url: str):
+    def __init__(self, current_version: str, update_url: str, download_url: str, cache_path: str = ''):
         self.current_version = current_version
         self.update_url = update_url
         self.download_url = download_url
+        self.cache_path = cache_path
+        self.last_error = ''
+    
+    def read_cache(self) -> Dict:
+        """Load the cached validators and last version.json payload"""
+        if not self.cache_path:
+            return {}
+        
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('url') == self.update_url:
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {}
+    
+    def write_cache(self, cache: Dict):
+        """Persist validators and payload (atomic replace)"""
+        if not self.cache_path:
+            return
+        
+        try:
+            tmp_path = self.cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+    
+    def fetch_version_data(self) -> Optional[Dict]:
+        """Fetch version.json with a conditional GET, 304 means use the cache"""
+        import urllib.request
+        import urllib.error
+        
+        cache = self.read_cache()
+        request = urllib.request.Request(self.update_url)
+        
+        if cache.get('payload') is not None:
+            if cache.get('etag'):
+                request.add_header('If-None-Match', cache['etag'])
+            if cache.get('last_modified'):
+                request.add_header('If-Modified-Since', cache['last_modified'])
+        
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                data = json.loads(response.read().decode('utf-8'))
+                headers = response.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cache.get('payload') is not None:
+                return cache['payload']
+            raise
+        
+        self.write_cache({
+            'url': self.update_url,
+            'etag': headers.get('ETag', ''),
+            'last_modified': headers.get('Last-Modified', ''),
+            'payload': data
+        })
+        return data
+    
+    def update_info_from(self, data: Optional[Dict]) -> Optional[Dict]:
+        """Turn a version.json payload into update info if it is newer"""
+        if not data:
+            return None
+        
+        remote_version = data.get('version', '0.0.0')
+        
+        if self.is_newer_version(remote_version, self.current_version):
+            return {
+                'version': remote_version,
+                'changelog': data.get('changelog', []),
+                'download_url': data.get('download_url', self.download_url),
+                'required': data.get('required', False),
+                'sha256': data.get('sha256', '')
+            }
+        
+        return None
+    
+    def cached_update_info(self) -> Optional[Dict]:
+        """Update info from the last fetched payload, without touching the network"""
+        return self.update_info_from(self.read_cache().get('payload'))
     
     def check_for_updates(self) -> Optional[Dict]:
-        """Check if updates are available"""
+        """Update info if a newer version is available, None if not.
+        
+        Network and parse errors are raised, so a failed check is never
+        mistaken for "up to date".
+        """
         # Skip if URLs not configured
         if not self.update_url or not self.update_url.strip():
             return None
         
-        try:
-            with urllib.request.urlopen(self.update_url, timeout=5) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                
-                remote_version = data.get('version', '0.0.0')
-                
-                if self.is_newer_version(remote_version, self.current_version):
-                    return {
-                        'version': remote_version,
-                        'changelog': data.get('changelog', []),
-                        'download_url': data.get('download_url', self.download_url),
-                        'required': data.get('required', False)
-                    }
-                
-                return None
-        except (urllib.error.URLError, json.JSONDecodeError, Exception):
-            return None
+        return self.update_info_from(self.fetch_version_data())
     
     def is_newer_version(self, remote: str, local: str) -> bool:
         """Compare version strings"""
@@ -92,45 +304,490 @@ class AutoUpdater:
         except Exception:
             return False
     
-    def download_update(self, download_url: str) -> Optional[str]:
-        """Download update file to temp location"""
+    def download_dir(self) -> str:
+        """Per-user private directory for partial downloads"""
+        import tempfile
+        
+        if sys.platform == 'win32':
+            parent = os.environ.get('LOCALAPPDATA') or tempfile.gettempdir()
+        else:
+            parent = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        os.makedirs(parent, exist_ok=True)
+        return private_dir(parent, 'chrome_launcher')
+    
+    def partial_download_path(self, download_url: str) -> str:
+        """Stable path for a download so an interrupted one can resume"""
+        import hashlib
+        
+        digest = hashlib.sha256(download_url.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.download_dir(), f'update_{digest}.part')
+    
+    @staticmethod
+    def discard_partial(temp_path: str):
+        """Remove a partial download and its resume metadata"""
+        for path in (temp_path, temp_path + '.json'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def resume_state(temp_path: str, download_url: str, expected_sha256: str) -> Optional[Dict]:
+        """Resume metadata for a partial download of this exact release, or None.
+        
+        Only a partial file we wrote ourselves, for the same URL and
+        sha256, with a validator and a known total length, is resumed.
+        """
+        try:
+            with open(temp_path + '.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            offset = os.path.getsize(temp_path)
+        except (OSError, ValueError):
+            return None
+        
+        if (not isinstance(meta, dict) or meta.get('url') != download_url
+                or meta.get('sha256') != expected_sha256 or not meta.get('validator')
+                or not isinstance(meta.get('total'), int) or not 0 < offset < meta['total']):
+            return None
+        
+        meta['offset'] = offset
+        return meta
+    
+    def download_update(self, download_url: str, expected_sha256: str,
+                        progress=None, cancel_event: Optional[threading.Event] = None) -> Optional[str]:
+        """Stream update file to a private temp location, resuming a partial one.
+        
+        progress(done_bytes, total_bytes, bytes_per_second) is called after
+        every chunk (total_bytes is 0 if the server did not say). The file
+        is only returned when its sha256 matches expected_sha256, which is
+        required. A resume sends If-Range with the ETag/Last-Modified seen
+        when the download started and must get back exactly the missing
+        byte range of the same total length; anything else starts over.
+        The reason for a None return is left in self.last_error.
+        """
+        import hashlib
+        import urllib.request
+        import urllib.error
+        
+        self.last_error = ''
+        expected_sha256 = (expected_sha256 or '').strip().lower()
+        if not expected_sha256:
+            self.last_error = 'version.json has no sha256 for this release'
+            return None
+        
         try:
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.py')
-            temp_path = temp_file.name
-            temp_file.close()
+            temp_path = self.partial_download_path(download_url)
+            meta_path = temp_path + '.json'
+            resume = self.resume_state(temp_path, download_url, expected_sha256)
+            if resume is None:
+                self.discard_partial(temp_path)
+            offset = resume['offset'] if resume else 0
+            
+            request = urllib.request.Request(download_url)
+            if offset:
+                request.add_header('Range', f'bytes={offset}-')
+                request.add_header('If-Range', resume['validator'])
+            
+            try:
+                response = urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT)
+            except urllib.error.HTTPError as e:
+                if e.code != 416 or not offset:
+                    raise
+                # Not proof the partial file is complete: fetch the whole file
+                self.discard_partial(temp_path)
+                offset = 0
+                response = urllib.request.urlopen(urllib.request.Request(download_url), timeout=DOWNLOAD_TIMEOUT)
+            
+            with response:
+                length = int(response.headers.get('Content-Length') or 0)
+                
+                if response.status == 206:
+                    expected_range = f'bytes {offset}-{resume["total"] - 1}/{resume["total"]}' if offset else None
+                    if response.headers.get('Content-Range', '').strip() != expected_range:
+                        self.discard_partial(temp_path)
+                        self.last_error = 'Server sent an unexpected byte range, retry to download again'
+                        return None
+                    total = resume['total']
+                else:
+                    # Full body: fresh download, or If-Range said the file changed
+                    offset = 0
+                    total = length
+                    etag = response.headers.get('ETag', '')
+                    validator = etag if etag and not etag.startswith('W/') else response.headers.get('Last-Modified', '')
+                    if validator and total:
+                        with open(meta_path, 'w', encoding='utf-8') as f:
+                            json.dump({'url': download_url, 'sha256': expected_sha256,
+                                       'validator': validator, 'total': total}, f)
+                    else:
+                        # Nothing to validate a resume against
+                        self.discard_partial(temp_path)
+                
+                digest = hashlib.sha256()
+                if offset:
+                    with open(temp_path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+                            digest.update(chunk)
+                
+                with open(temp_path, 'ab' if offset else 'wb') as f:
+                    done = offset
+                    start = time.monotonic()
+                    
+                    while True:
+                        if cancel_event is not None and cancel_event.is_set():
+                            self.last_error = 'Download cancelled'
+                            return None
+                        
+                        chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        
+                        f.write(chunk)
+                        digest.update(chunk)
+                        done += len(chunk)
+                        
+                        if progress:
+                            elapsed = time.monotonic() - start
+                            progress(done, total, (done - offset) / elapsed if elapsed > 0 else 0.0)
+            
+            if total and done < total:
+                # Connection dropped early, keep the partial file for a resume
+                self.last_error = f'Download interrupted at {done} of {total} bytes'
+                return None
             
-            urllib.request.urlretrieve(download_url, temp_path)
+            if (total and done != total) or digest.hexdigest() != expected_sha256:
+                self.last_error = 'Checksum mismatch (sha256)'
+                self.discard_partial(temp_path)
+                return None
             
+            try:
+                os.remove(meta_path)
+            except OSError:
+                pass
             return temp_path
-        except Exception:
+        except Exception as e:
+            # Keep the partial file for the next attempt
+            self.last_error = str(e)
             return None
     
     def apply_update(self, temp_path: str, target_path: str) -> bool:
-        """Apply update by replacing current file"""
+        """Apply update by atomically replacing current file"""
+        backup_path = target_path + '.backup'
+        staged_path = target_path + '.new'
+        
         try:
             # Backup current file
-            backup_path = target_path + '.backup'
             if os.path.exists(target_path):
                 shutil.copy2(target_path, backup_path)
             
-            # Replace with new file
-            shutil.copy2(temp_path, target_path)
+            # Stage next to the target so os.replace stays on one filesystem
+            shutil.copyfile(temp_path, staged_path)
             
             # Make executable on Unix
             if sys.platform != 'win32':
-                os.chmod(target_path, 0o755)
+                os.chmod(staged_path, 0o755)
             
+            os.replace(staged_path, target_path)
             return True
         except Exception:
-            # Restore backup if failed
-            if os.path.exists(backup_path):
-                shutil.copy2(backup_path, target_path)
+            # The target is either the old file or the new one, never half-written
+            try:
+                os.remove(staged_path)
+            except OSError:
+                pass
             return False
 
 
+class UpdateCheckWorker:
+    """Run AutoUpdater.check_for_updates on a background thread.
+    
+    Results come back through a queue that the Tk thread polls with
+    after(). A request made while a check is already running joins it
+    instead of starting a second network round-trip.
+    """
+    
+    def __init__(self, updater: AutoUpdater):
+        self.updater = updater
+        self.results: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._running = False
+        self._waiters: List[str] = []
+    
+    @property
+    def busy(self) -> bool:
+        with self._lock:
+            return self._running
+    
+    def request(self, source: str) -> bool:
+        """Ask for a check on behalf of source ('auto', 'manual', ...).
+        
+        Returns True if a new check was started, False if source joined
+        the one already in flight.
+        """
+        with self._lock:
+            if source not in self._waiters:
+                self._waiters.append(source)
+            if self._running:
+                return False
+            self._running = True
+        
+        threading.Thread(target=self._run, name='update-check', daemon=True).start()
+        return True
+    
+    def _run(self):
+        """Worker thread body"""
+        update_info = None
+        error = None
+        try:
+            update_info = self.updater.check_for_updates()
+        except Exception as e:
+            error = e
+        
+        with self._lock:
+            sources = self._waiters
+            self._waiters = []
+            self._running = False
+        
+        self.results.put((sources, update_info, error))
+
+
+class SQLiteStateStore:
+    """SQLite (WAL) home for usage, recents, per-URL, custom URLs and search history.
+    
+    Every change is a single-row upsert instead of a full cfg rewrite, and
+    quick launch reads the top of an index instead of sorting all usage.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS usage (email TEXT PRIMARY KEY, count INTEGER NOT NULL);
+        CREATE INDEX IF NOT EXISTS usage_by_count ON usage (count DESC);
+        CREATE TABLE IF NOT EXISTS recents (email TEXT PRIMARY KEY, seq INTEGER NOT NULL);
+        CREATE INDEX IF NOT EXISTS recents_by_seq ON recents (seq DESC);
+        CREATE TABLE IF NOT EXISTS per_url (email TEXT PRIMARY KEY, choice TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS custom_urls (name TEXT PRIMARY KEY, url TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS search_history (query TEXT PRIMARY KEY, seq INTEGER NOT NULL);
+        CREATE INDEX IF NOT EXISTS history_by_seq ON search_history (seq DESC);
+    """
+    
+    RECENTS_LIMIT = 10
+    HISTORY_LIMIT = 20
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(self.SCHEMA)
+    
+    def close(self):
+        """Close the connection"""
+        with self._lock:
+            self.conn.close()
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a meta value"""
+        with self._lock:
+            row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set_meta(self, key: str, value: str):
+        """Write a meta value"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO meta (key, value) VALUES (?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                (key, value)
+            )
+    
+    def bump_usage(self, email: str):
+        """Increment one usage counter"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO usage (email, count) VALUES (?, 1) '
+                'ON CONFLICT(email) DO UPDATE SET count = count + 1',
+                (email,)
+            )
+    
+    def add_recent(self, email: str):
+        """Move email to the front of recents and trim the tail"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO recents (email, seq) '
+                'VALUES (?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM recents)) '
+                'ON CONFLICT(email) DO UPDATE SET seq = excluded.seq',
+                (email,)
+            )
+            self.conn.execute(
+                'DELETE FROM recents WHERE email NOT IN '
+                '(SELECT email FROM recents ORDER BY seq DESC LIMIT ?)',
+                (self.RECENTS_LIMIT,)
+            )
+    
+    def add_search_history(self, query: str):
+        """Add a new query at the front of the history (existing ones stay put)"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT OR IGNORE INTO search_history (query, seq) '
+                'VALUES (?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM search_history))',
+                (query,)
+            )
+            self.conn.execute(
+                'DELETE FROM search_history WHERE query NOT IN '
+                '(SELECT query FROM search_history ORDER BY seq DESC LIMIT ?)',
+                (self.HISTORY_LIMIT,)
+            )
+    
+    def clear_search_history(self):
+        """Forget all searches"""
+        with self._lock, self.conn:
+            self.conn.execute('DELETE FROM search_history')
+    
+    def replace_custom_urls(self, custom_urls: Dict[str, str]):
+        """Replace the custom URL table"""
+        with self._lock, self.conn:
+            self.conn.execute('DELETE FROM custom_urls')
+            self.conn.executemany('INSERT INTO custom_urls (name, url) VALUES (?, ?)', custom_urls.items())
+    
+    def top_usage(self, k: int, present=None) -> List[Tuple[str, int]]:
+        """Top k (email, count) by usage, optionally only emails in present"""
+        # Pages off the usage_by_count index; more pages only if present filters rows out
+        top = []
+        page = k if present is None else max(k, 64)
+        offset = 0
+        with self._lock:
+            while len(top) < k:
+                rows = self.conn.execute(
+                    'SELECT email, count FROM usage ORDER BY count DESC LIMIT ? OFFSET ?',
+                    (page, offset)
+                ).fetchall()
+                top.extend(row for row in rows if present is None or row[0] in present)
+                if len(rows) < page:
+                    break
+                offset += page
+        return top[:k]
+    
+    def import_state(self, config: 'ChromeLauncherConfig'):
+        """Replace all stored state with the state held by config"""
+        recents = config.recents[:self.RECENTS_LIMIT]
+        history = config.search_history[:self.HISTORY_LIMIT]
+        
+        with self._lock, self.conn:
+            for table in ('usage', 'recents', 'per_url', 'custom_urls', 'search_history'):
+                self.conn.execute(f'DELETE FROM {table}')
+            
+            self.conn.executemany('INSERT INTO usage (email, count) VALUES (?, ?)', config.usage.items())
+            self.conn.executemany('INSERT INTO per_url (email, choice) VALUES (?, ?)', config.per_url.items())
+            self.conn.executemany('INSERT INTO custom_urls (name, url) VALUES (?, ?)', config.custom_urls.items())
+            # Lists are newest first, so the first item gets the highest seq
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO recents (email, seq) VALUES (?, ?)',
+                ((email, len(recents) - i) for i, email in enumerate(recents))
+            )
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO search_history (query, seq) VALUES (?, ?)',
+                ((query, len(history) - i) for i, query in enumerate(history))
+            )
+    
+    def load_into(self, config: 'ChromeLauncherConfig'):
+        """Fill config's in-memory state from the store"""
+        with self._lock:
+            conn = self.conn
+            config.usage = dict(conn.execute('SELECT email, count FROM usage'))
+            config.per_url = dict(conn.execute('SELECT email, choice FROM per_url'))
+            config.custom_urls = dict(conn.execute('SELECT name, url FROM custom_urls'))
+            config.recents = [row[0] for row in conn.execute('SELECT email FROM recents ORDER BY seq DESC')]
+            config.search_history = [
+                row[0] for row in conn.execute('SELECT query FROM search_history ORDER BY seq DESC')
+            ]
+
+
+def _cfg_digit(value: str) -> Optional[str]:
+    """First character if it is a digit (URL_CHOICE=1)"""
+    return value[0] if value[:1].isdecimal() else None
+
+
+def _cfg_number(value: str) -> Optional[str]:
+    """Leading digits (UPDATE_CHECK_INTERVAL=24)"""
+    match = NUMBER_RE.match(value)
+    return match.group() if match else None
+
+
+def _cfg_count(value: str) -> Optional[int]:
+    """Leading digits as int (USAGE_x=3)"""
+    match = NUMBER_RE.match(value)
+    return int(match.group()) if match else None
+
+
+def _cfg_text(value: str) -> Optional[str]:
+    """Non-empty value, stripped (LAST_EMAIL=...)"""
+    return value.strip() if value else None
+
+
+def _cfg_raw(value: str) -> Optional[str]:
+    """Non-empty value as-is (PER_URL_x=...)"""
+    return value if value else None
+
+
+def _cfg_emails(value: str) -> List[str]:
+    """Comma separated emails (FAVORITES=a@x,b@x)"""
+    return [e for e in value.split(',') if '@' in e]
+
+
+def _cfg_history(value: str) -> List[str]:
+    """Pipe separated search history"""
+    return [h for h in value.split('|') if h]
+
+
 class ChromeLauncherConfig:
     """Configuration manager for Chrome Launcher"""
     
+    # KEY=value lines: key -> (attribute, parser). A parser returning None
+    # leaves the attribute at its current value.
+    SCALAR_KEYS = {
+        'URL_CHOICE': ('url_choice', _cfg_digit),
+        'LAST_EMAIL': ('last_email', _cfg_text),
+        'CHANNEL': ('channel', _cfg_text),
+        'WINDOW_X': ('window_x', _cfg_text),
+        'WINDOW_Y': ('window_y', _cfg_text),
+        'WINDOW_W': ('window_w', _cfg_text),
+        'WINDOW_H': ('window_h', _cfg_text),
+        'FAVORITES': ('favorites', _cfg_emails),
+        'RECENTS': ('recents', _cfg_emails),
+        'USE_PERURL': ('use_perurl', _cfg_digit),
+        'THEME': ('theme', _cfg_text),
+        'CUSTOM_CHROME': ('custom_chrome', str.strip),
+        'AUTO_UPDATE_CHECK': ('auto_update_check', _cfg_digit),
+        'LAST_UPDATE_CHECK': ('last_update_check', _cfg_text),
+        'UPDATE_CHECK_INTERVAL': ('update_check_interval', _cfg_number),
+        'STATE_BACKEND': ('state_backend', _cfg_text),
+        'LOG_BUFFERED': ('log_buffered', _cfg_digit),
+        'LOG_MAX_KB': ('log_max_kb', _cfg_number),
+        'LOG_BACKUPS': ('log_backups', _cfg_number),
+        'BATCH_CONCURRENCY': ('batch_concurrency', _cfg_number),
+        'BATCH_STAGGER_MS': ('batch_stagger_ms', _cfg_number),
+        'NEW_WINDOW': ('new_window', _cfg_digit),
+        'SEARCH_MODE': ('search_mode', _cfg_text),
+        'SEARCH_TOP_K': ('search_top_k', _cfg_number),
+        'SINGLE_INSTANCE': ('single_instance', _cfg_digit),
+        'BATCH_SKIP_RUNNING': ('batch_skip_running', _cfg_digit),
+        'DEVTOOLS_TABS': ('devtools_tabs', _cfg_digit),
+        'DEVTOOLS_BASE_PORT': ('devtools_base_port', _cfg_number),
+        'WARM_POOL': ('warm_pool', _cfg_digit),
+        'WARM_POOL_SIZE': ('warm_pool_size', _cfg_number),
+        'WARM_POOL_BUDGET_MB': ('warm_pool_budget_mb', _cfg_number),
+        'SEARCH_HISTORY': ('search_history', _cfg_history),
+        'QUICK_LAUNCH': ('quick_launch_profiles', _cfg_emails),
+    }
+    
+    # PREFIX<name>=value lines: (prefix, dict attribute, parser)
+    PREFIX_KEYS = (
+        ('USAGE_', 'usage', _cfg_count),
+        ('PER_URL_', 'per_url', _cfg_raw),
+        ('CUSTOM_URL_', 'custom_urls', _cfg_raw),
+        ('DEVTOOLS_PORT_', 'devtools_ports', _cfg_count),
+    )
+    
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.url_choice = '1'
@@ -152,61 +809,186 @@ class ChromeLauncherConfig:
         self.quick_launch_profiles = []
         self.auto_update_check = '1'
         self.last_update_check = ''
-        
+        self.update_check_interval = '24'
+        self.state_backend = 'text'
+        self.log_buffered = '1'
+        self.log_max_kb = '1024'
+        self.log_backups = '3'
+        self.batch_concurrency = '4'
+        self.batch_stagger_ms = '250'
+        self.new_window = '0'
+        self.search_mode = 'Exact'
+        self.search_top_k = '50'
+        self.single_instance = '1'
+        self.batch_skip_running = '0'
+        self.devtools_tabs = '0'
+        self.devtools_base_port = '9300'
+        self.devtools_ports = {}
+        self.warm_pool = '0'
+        self.warm_pool_size = '6'
+        self.warm_pool_budget_mb = '3072'
+        self.store: Optional[SQLiteStateStore] = None
+        
+        # Write-behind state
+        self.save_delay_ms = 1000
+        self.dirty = False
+        self.write_count = 0
+        self.bytes_written = 0
+        self.skipped_writes = 0
+        self._last_written = None
+        self._schedule = None
+        self._cancel = None
+        self._pending = None
+    
+    @property
+    def db_path(self) -> str:
+        """SQLite state file used when STATE_BACKEND=sqlite"""
+        return os.path.splitext(self.config_path)[0] + '.db'
+    
     def load(self):
-        """Load configuration from file"""
-        if not os.path.exists(self.config_path):
+        """Load configuration from file (and the SQLite store if enabled)"""
+        on_disk = None
+        if os.path.exists(self.config_path):
+            on_disk = self.parse_file(self.config_path)
+        
+        if self.state_backend == 'sqlite' and sqlite3 is not None:
+            if self.store is None:
+                self.store = SQLiteStateStore(self.db_path)
+            
+            if self.store.get_meta('migrated_from_cfg') is None:
+                # One-time move of the cfg's state lines into the database
+                if os.path.exists(self.config_path):
+                    backup_path = self.config_path + '.pre-sqlite'
+                    if not os.path.exists(backup_path):
+                        shutil.copy2(self.config_path, backup_path)
+                self.store.import_state(self)
+                self.store.set_meta('migrated_from_cfg', datetime.now().isoformat())
+            
+            self.store.load_into(self)
+        
+        # What is on disk now, so an unchanged save() can be skipped
+        self._last_written = on_disk
+    
+    def parse_file(self, path: str) -> str:
+        """Merge settings from a cfg-format file into this config, returns its text"""
+        scalar_keys = self.SCALAR_KEYS
+        prefix_keys = self.PREFIX_KEYS
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        
+        # Same logic as apply_setting, inlined: this loop is the hot path
+        for line in text.split('\n'):
+            key, sep, value = line.strip().partition('=')
+            if not sep:
+                continue
+            
+            entry = scalar_keys.get(key)
+            if entry is not None:
+                attr, parse = entry
+                parsed = parse(value)
+                if parsed is not None:
+                    setattr(self, attr, parsed)
+                continue
+            
+            for prefix, attr, parse in prefix_keys:
+                if key.startswith(prefix):
+                    name = key[len(prefix):]
+                    parsed = parse(value)
+                    if name and parsed is not None:
+                        getattr(self, attr)[name] = parsed
+                    break
+        
+        return text
+    
+    @staticmethod
+    def settings_from(text: str) -> Dict[str, str]:
+        """KEY -> raw value for every KEY=value line (last one wins)"""
+        settings = {}
+        for line in text.split('\n'):
+            key, sep, value = line.strip().partition('=')
+            if sep:
+                settings[key] = value
+        return settings
+    
+    def apply_setting(self, key: str, value: str):
+        """Set the attribute behind one cfg line"""
+        entry = self.SCALAR_KEYS.get(key)
+        if entry is not None:
+            attr, parse = entry
+            parsed = parse(value)
+            if parsed is not None:
+                setattr(self, attr, parsed)
             return
+        
+        for prefix, attr, parse in self.PREFIX_KEYS:
+            if key.startswith(prefix):
+                name = key[len(prefix):]
+                parsed = parse(value)
+                if name and parsed is not None:
+                    getattr(self, attr)[name] = parsed
+                return
+    
+    def merge_external(self) -> bool:
+        """Merge a cfg rewritten by another process (e.g. a CLI launch) into memory.
+        
+        Keys the other writer changed since our last load/save take its
+        value, except usage counts, which add up, and recents, which go to
+        the front of ours. Returns True if anything was merged.
+        """
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            return False
+        
+        if text == self._last_written:
+            # Our own save() (or no real change)
+            return False
+        
+        base = self.settings_from(self._last_written or '')
+        theirs = self.settings_from(text)
+        
+        for key in base.keys() | theirs.keys():
+            old = base.get(key)
+            new = theirs.get(key)
+            if old == new:
+                continue
             
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                
-                if match := re.match(r'URL_CHOICE=(\d)', line):
-                    self.url_choice = match.group(1)
-                elif match := re.match(r'LAST_EMAIL=(.+)', line):
-                    self.last_email = match.group(1).strip()
-                elif match := re.match(r'CHANNEL=(.+)', line):
-                    self.channel = match.group(1).strip()
-                elif match := re.match(r'WINDOW_X=(.+)', line):
-                    self.window_x = match.group(1).strip()
-                elif match := re.match(r'WINDOW_Y=(.+)', line):
-                    self.window_y = match.group(1).strip()
-                elif match := re.match(r'WINDOW_W=(.+)', line):
-                    self.window_w = match.group(1).strip()
-                elif match := re.match(r'WINDOW_H=(.+)', line):
-                    self.window_h = match.group(1).strip()
-                elif match := re.match(r'FAVORITES=(.*)', line):
-                    favs = match.group(1).split(',')
-                    self.favorites = [f for f in favs if '@' in f]
-                elif match := re.match(r'RECENTS=(.*)', line):
-                    recs = match.group(1).split(',')
-                    self.recents = [r for r in recs if '@' in r]
-                elif match := re.match(r'USE_PERURL=(\d)', line):
-                    self.use_perurl = match.group(1)
-                elif match := re.match(r'THEME=(.+)', line):
-                    self.theme = match.group(1).strip()
-                elif match := re.match(r'CUSTOM_CHROME=(.*)', line):
-                    self.custom_chrome = match.group(1).strip()
-                elif match := re.match(r'AUTO_UPDATE_CHECK=(\d)', line):
-                    self.auto_update_check = match.group(1)
-                elif match := re.match(r'LAST_UPDATE_CHECK=(.+)', line):
-                    self.last_update_check = match.group(1).strip()
-                elif match := re.match(r'PER_URL_(.+?)=(.+)', line):
-                    self.per_url[match.group(1)] = match.group(2)
-                elif match := re.match(r'USAGE_(.+?)=(\d+)', line):
-                    self.usage[match.group(1)] = int(match.group(2))
-                elif match := re.match(r'CUSTOM_URL_(.+?)=(.+)', line):
-                    self.custom_urls[match.group(1)] = match.group(2)
-                elif match := re.match(r'SEARCH_HISTORY=(.*)', line):
-                    hist = match.group(1).split('|')
-                    self.search_history = [h for h in hist if h]
-                elif match := re.match(r'QUICK_LAUNCH=(.*)', line):
-                    profiles = match.group(1).split(',')
-                    self.quick_launch_profiles = [p for p in profiles if '@' in p]
+            if key.startswith('USAGE_'):
+                name = key[len('USAGE_'):]
+                delta = (_cfg_count(new or '') or 0) - (_cfg_count(old or '') or 0)
+                if name:
+                    self.usage[name] = max(0, self.usage.get(name, 0) + delta)
+            elif key == 'RECENTS':
+                recents = _cfg_emails(new or '')
+                self.recents = (recents + [r for r in self.recents if r not in recents])[:10]
+            elif new is None:
+                for prefix, attr, _ in self.PREFIX_KEYS:
+                    if key.startswith(prefix):
+                        getattr(self, attr).pop(key[len(prefix):], None)
+                        break
+            else:
+                self.apply_setting(key, new)
+        
+        self._last_written = text
+        if self.store is not None:
+            self.store.load_into(self)
+        
+        # Write back only if we hold changes the other writer didn't have
+        if self.serialize() != text:
+            self.mark_dirty()
+        return True
     
-    def save(self):
-        """Save configuration to file"""
+    def serialize(self, include_state: Optional[bool] = None) -> str:
+        """Render configuration in cfg text format.
+        
+        State (usage, recents, per-URL, custom URLs, history) is left out
+        when it lives in SQLite, unless include_state is True (export).
+        """
+        if include_state is None:
+            include_state = self.store is None
+        
         lines = [
             f"URL_CHOICE={self.url_choice}",
             f"LAST_EMAIL={self.last_email}",
@@ -220,29 +1002,186 @@ class ChromeLauncherConfig:
             f"CUSTOM_CHROME={self.custom_chrome}",
             f"AUTO_UPDATE_CHECK={self.auto_update_check}",
             f"LAST_UPDATE_CHECK={self.last_update_check}",
+            f"UPDATE_CHECK_INTERVAL={self.update_check_interval}",
+            f"STATE_BACKEND={self.state_backend}",
+            f"LOG_BUFFERED={self.log_buffered}",
+            f"LOG_MAX_KB={self.log_max_kb}",
+            f"LOG_BACKUPS={self.log_backups}",
+            f"BATCH_CONCURRENCY={self.batch_concurrency}",
+            f"BATCH_STAGGER_MS={self.batch_stagger_ms}",
+            f"NEW_WINDOW={self.new_window}",
+            f"SEARCH_MODE={self.search_mode}",
+            f"SEARCH_TOP_K={self.search_top_k}",
+            f"SINGLE_INSTANCE={self.single_instance}",
+            f"BATCH_SKIP_RUNNING={self.batch_skip_running}",
+            f"DEVTOOLS_TABS={self.devtools_tabs}",
+            f"DEVTOOLS_BASE_PORT={self.devtools_base_port}",
+            f"WARM_POOL={self.warm_pool}",
+            f"WARM_POOL_SIZE={self.warm_pool_size}",
+            f"WARM_POOL_BUDGET_MB={self.warm_pool_budget_mb}",
             f"FAVORITES={','.join(self.favorites)}",
-            f"RECENTS={','.join(self.recents)}",
-            f"SEARCH_HISTORY={'|'.join(self.search_history[:20])}",
-            f"QUICK_LAUNCH={','.join(self.quick_launch_profiles)}",
         ]
         
-        for key, val in self.per_url.items():
-            lines.append(f"PER_URL_{key}={val}")
+        if include_state:
+            lines.append(f"RECENTS={','.join(self.recents)}")
+            lines.append(f"SEARCH_HISTORY={'|'.join(self.search_history[:20])}")
+        
+        lines.append(f"QUICK_LAUNCH={','.join(self.quick_launch_profiles)}")
+        
+        for key, port in self.devtools_ports.items():
+            lines.append(f"DEVTOOLS_PORT_{key}={port}")
+        
+        if include_state:
+            for key, val in self.per_url.items():
+                lines.append(f"PER_URL_{key}={val}")
+            
+            for key, val in self.usage.items():
+                lines.append(f"USAGE_{key}={val}")
             
-        for key, val in self.usage.items():
-            lines.append(f"USAGE_{key}={val}")
+            for key, val in self.custom_urls.items():
+                lines.append(f"CUSTOM_URL_{key}={val}")
+        
+        return '\n'.join(lines) + '\n'
+    
+    def save(self):
+        """Save configuration to file now (atomic replace)"""
+        self.cancel_pending()
+        self.dirty = False
+        
+        text = self.serialize()
+        if text == self._last_written and os.path.exists(self.config_path):
+            self.skipped_writes += 1
+            return
+        
+        data = text.encode('utf-8')
+        tmp_path = self.config_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.config_path)
+        
+        self._last_written = text
+        self.write_count += 1
+        self.bytes_written += len(data)
+    
+    def set_scheduler(self, schedule, cancel):
+        """Use schedule(delay_ms, callback) / cancel(handle) for write-behind (e.g. root.after)"""
+        self._schedule = schedule
+        self._cancel = cancel
+    
+    def mark_dirty(self):
+        """Note a change and write it soon, coalescing bursts into one write.
         
-        for key, val in self.custom_urls.items():
-            lines.append(f"CUSTOM_URL_{key}={val}")
+        Without a scheduler (CLI use) the change is saved immediately.
+        """
+        self.dirty = True
+        
+        if self._schedule is None:
+            self.save()
+            return
         
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines) + '\n')
+        if self._pending is None:
+            self._pending = self._schedule(self.save_delay_ms, self.flush)
+    
+    def flush(self):
+        """Write pending changes, if any"""
+        self._pending = None
+        if self.dirty:
+            self.save()
+    
+    def cancel_pending(self):
+        """Drop a scheduled write-behind (the caller saves or discards)"""
+        if self._pending is not None and self._cancel is not None:
+            try:
+                self._cancel(self._pending)
+            except Exception:
+                pass
+        self._pending = None
+    
+    def export_file(self, path: str):
+        """Write the full config, state included, in cfg text format"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.serialize(include_state=True))
+    
+    def import_file(self, path: str):
+        """Merge a cfg-format file (e.g. an export) and persist it"""
+        self.cancel_pending()
+        self.parse_file(path)
+        if self.store is not None:
+            self.store.import_state(self)
+        self.save()
     
     def add_search_history(self, query: str):
         """Add to search history"""
         if query and query not in self.search_history:
             self.search_history.insert(0, query)
             self.search_history = self.search_history[:20]
+            if self.store is not None:
+                self.store.add_search_history(query)
+    
+    def clear_search_history(self):
+        """Forget all searches"""
+        self.search_history = []
+        if self.store is not None:
+            self.store.clear_search_history()
+    
+    def add_recent(self, email: str):
+        """Move email to the front of recents (max 10)"""
+        recents = [r for r in self.recents if r != email]
+        recents.insert(0, email)
+        self.recents = recents[:10]
+        if self.store is not None:
+            self.store.add_recent(email)
+    
+    def bump_usage(self, email: str):
+        """Increment usage count"""
+        self.usage[email] = self.usage.get(email, 0) + 1
+        if self.store is not None:
+            self.store.bump_usage(email)
+    
+    def devtools_port_for(self, channel: str, profile: str) -> int:
+        """Remote-debugging port of a profile, assigned once and never shared.
+        
+        A new profile gets the lowest port from DEVTOOLS_BASE_PORT up that
+        no other profile holds and nothing is listening on right now.
+        """
+        key = f'{channel}:{profile}'
+        port = self.devtools_ports.get(key)
+        if port:
+            return port
+        
+        taken = set(self.devtools_ports.values())
+        port = int(self.devtools_base_port or 9300)
+        while port in taken or not port_is_free(port):
+            port += 1
+        
+        self.devtools_ports[key] = port
+        self.mark_dirty()
+        return port
+    
+    def default_url_for(self, email: str, urls: Dict[str, str] = DEFAULT_URLS) -> str:
+        """Default URL for a profile (per-URL choice if enabled)"""
+        choice = self.url_choice
+        if self.use_perurl == '1' and email in self.per_url:
+            choice = self.per_url[email]
+        return urls.get(choice, urls['1'])
+    
+    def set_custom_urls(self, custom_urls: Dict[str, str]):
+        """Replace custom URLs"""
+        self.custom_urls = dict(custom_urls)
+        if self.store is not None:
+            self.store.replace_custom_urls(self.custom_urls)
+    
+    def top_usage(self, k: int, present=None) -> List[Tuple[str, int]]:
+        """Top k (email, count) by usage, optionally only emails in present"""
+        if self.store is not None:
+            return self.store.top_usage(k, present)
+        
+        items = self.usage.items()
+        if present is not None:
+            items = [(email, count) for email, count in items if email in present]
+        return heapq.nlargest(k, items, key=lambda item: item[1])
 
 
 class ChromePathFinder:
@@ -298,142 +1237,1850 @@ class ChromePathFinder:
         
         return None
     
+    @staticmethod
+    def channel_for_path(path: str) -> Optional[str]:
+        """Channel whose install is path (None for a custom binary)"""
+        for channel in ['Stable', 'Beta', 'Dev', 'Canary']:
+            if ChromePathFinder.get_chrome_path_for_channel(channel) == path:
+                return channel
+        return None
+    
     @staticmethod
     def get_chrome_path_auto(preferred: str, custom: str = '') -> Optional[str]:
         """Get Chrome path automatically"""
         if custom and os.path.exists(custom):
             return custom
         
-        path = ChromePathFinder.get_chrome_path_for_channel(preferred)
-        if path:
-            return path
+        path = ChromePathFinder.get_chrome_path_for_channel(preferred)
+        if path:
+            return path
+        
+        for channel in ['Stable', 'Beta', 'Dev', 'Canary']:
+            path = ChromePathFinder.get_chrome_path_for_channel(channel)
+            if path:
+                return path
+        
+        return None
+
+
+class ChromeInstallRegistry:
+    """Installed Chrome channels, discovered once and kept in memory.
+    
+    Paths are not looked up again until refresh() is called, e.g. after
+    a launch failed. Versions are probed lazily and cached by the
+    binary's mtime, which version() stats on every lookup, so an
+    in-place Chrome update is picked up without a refresh.
+    """
+    
+    CHANNELS = ['Stable', 'Beta', 'Dev', 'Canary']
+    VERSION_RE = re.compile(r'\d+\.\d+\.\d+\.\d+')
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._installs: Optional[Dict[str, str]] = None
+        self._custom: Optional[Tuple[str, bool]] = None
+        self._versions: Dict[Tuple[str, int], str] = {}
+    
+    @staticmethod
+    def _mtime(path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+    
+    def _discover(self) -> Dict[str, str]:
+        """channel -> path for every installed channel (lock held)"""
+        if self._installs is None:
+            installs = {}
+            for channel in self.CHANNELS:
+                path = ChromePathFinder.get_chrome_path_for_channel(channel)
+                if path:
+                    installs[channel] = path
+            self._installs = installs
+        return self._installs
+    
+    def refresh(self):
+        """Forget cached paths so the next lookup re-probes the disk"""
+        with self._lock:
+            self._installs = None
+            self._custom = None
+    
+    def installed(self) -> Dict[str, str]:
+        """channel -> executable path"""
+        with self._lock:
+            return dict(self._discover())
+    
+    def channel_of(self, path: str) -> Optional[str]:
+        """Channel whose install is path (None for a custom binary)"""
+        with self._lock:
+            return next((channel for channel, p in self._discover().items() if p == path), None)
+    
+    def resolve(self, preferred: str, custom: str = '') -> Optional[str]:
+        """Custom path, else preferred channel, else any installed channel"""
+        if custom:
+            with self._lock:
+                if self._custom is None or self._custom[0] != custom:
+                    self._custom = (custom, os.path.exists(custom))
+                if self._custom[1]:
+                    return custom
+        
+        with self._lock:
+            installs = self._discover()
+            path = installs.get(preferred)
+            if path is None:
+                path = next((installs[c] for c in self.CHANNELS if c in installs), None)
+        return path
+    
+    def version(self, channel: str) -> str:
+        """Version string of an installed channel ('' if unknown), probed on first use"""
+        with self._lock:
+            path = self._discover().get(channel)
+        if path is None:
+            return ''
+        
+        key = (path, self._mtime(path))
+        with self._lock:
+            if key in self._versions:
+                return self._versions[key]
+        
+        version = self._probe_version(path)
+        with self._lock:
+            self._versions[key] = version
+        return version
+    
+    def _probe_version(self, path: str) -> str:
+        """Ask the binary (or, on Windows, its versioned sibling folder)"""
+        try:
+            if sys.platform == 'win32':
+                folder = os.path.dirname(path)
+                versions = [d for d in os.listdir(folder) if self.VERSION_RE.fullmatch(d)]
+                return max(versions, key=lambda v: [int(x) for x in v.split('.')], default='')
+            
+            output = subprocess.run(
+                [path, '--version'], capture_output=True, text=True, timeout=10
+            ).stdout
+            match = self.VERSION_RE.search(output)
+            return match.group() if match else ''
+        except Exception:
+            return ''
+
+
+class ProfileIndex:
+    """Parsed view of the Local State profile cache, reused until the file changes"""
+    
+    _cache: Dict[str, 'ProfileIndex'] = {}
+    _lock = threading.Lock()
+    
+    def __init__(self, path: str, signature: Tuple[int, int], info_cache: Dict,
+                 last_active: Optional[List[str]] = None):
+        self.path = path
+        self.signature = signature
+        self.by_email: Dict[str, Dict] = {}
+        self.email_for_dir: Dict[str, str] = {}
+        # Profiles the browser reports as open (kept up to date while it runs)
+        self.last_active: List[str] = list(last_active or [])
+        
+        emails = []
+        for profile_dir, profile_info in info_cache.items():
+            gaia_info = profile_info.get('gaia_info', {})
+            gaia_email = gaia_info.get('email', '')
+            user_name = profile_info.get('user_name', '')
+            info = {
+                'name': profile_info.get('name', ''),
+                'profile_dir': profile_dir,
+                'user_name': user_name,
+                'gaia_name': gaia_info.get('given_name', '')
+            }
+            
+            # First profile wins, same as the old linear scan
+            for key in (gaia_email, user_name):
+                if key and key not in self.by_email:
+                    self.by_email[key] = info
+            
+            primary = gaia_email or user_name
+            if primary:
+                emails.append(primary)
+                self.email_for_dir[profile_dir] = primary
+        
+        self._primary = set(e for e in emails if '@' in e)
+        self._emails: Optional[List[str]] = None
+    
+    @property
+    def emails(self) -> List[str]:
+        """Profile emails sorted by number, sorted on first use (CLI lookups never need it)"""
+        if self._emails is None:
+            self._emails = sorted(self._primary, key=email_sort_key)
+        return self._emails
+    
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> Optional['ProfileIndex']:
+        """Return the index for Local State, re-parsing only if (mtime, size) changed"""
+        if path is None:
+            path = ChromeProfileManager.get_local_state_path()
+        
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        
+        signature = (st.st_mtime_ns, st.st_size)
+        
+        with cls._lock:
+            cached = cls._cache.get(path)
+            if cached is not None and cached.signature == signature:
+                return cached
+            
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            profile = data.get('profile', {})
+            index = cls(path, signature, profile.get('info_cache', {}), profile.get('last_active_profiles'))
+            cls._cache[path] = index
+            return index
+    
+    @classmethod
+    def invalidate(cls):
+        """Drop all cached indexes"""
+        with cls._lock:
+            cls._cache.clear()
+    
+    def profile_dir_for(self, email: str) -> Optional[str]:
+        """O(1) email -> profile directory lookup"""
+        info = self.by_email.get(email)
+        return info['profile_dir'] if info else None
+    
+    def info_for(self, email: str) -> Dict:
+        """O(1) email -> profile info lookup"""
+        info = self.by_email.get(email)
+        if not info:
+            return {}
+        return {'email': email, **info}
+
+
+class ChromeProfileManager:
+    """Manage Chrome profiles"""
+    
+    # Per-channel folder of the default user data dir: (Windows, macOS, Linux)
+    USER_DATA_FOLDERS = {
+        'Stable': ('Chrome', 'Chrome', 'google-chrome'),
+        'Beta': ('Chrome Beta', 'Chrome Beta', 'google-chrome-beta'),
+        'Dev': ('Chrome Dev', 'Chrome Dev', 'google-chrome-unstable'),
+        'Canary': ('Chrome SxS', 'Chrome Canary', 'google-chrome-canary'),
+    }
+    
+    @staticmethod
+    def get_user_data_dir(channel: str = 'Stable') -> str:
+        """Default user data dir of a Chrome channel"""
+        windows, mac, linux = ChromeProfileManager.USER_DATA_FOLDERS.get(
+            channel, ChromeProfileManager.USER_DATA_FOLDERS['Stable']
+        )
+        if sys.platform == 'win32':
+            local_appdata = os.environ.get('LOCALAPPDATA', '')
+            return os.path.join(local_appdata, 'Google', windows, 'User Data')
+        elif sys.platform == 'darwin':
+            home = os.path.expanduser('~')
+            return os.path.join(home, 'Library', 'Application Support', 'Google', mac)
+        else:
+            home = os.path.expanduser('~')
+            return os.path.join(home, '.config', linux)
+    
+    @staticmethod
+    def get_local_state_path() -> str:
+        """Get path to Chrome Local State file"""
+        return os.path.join(ChromeProfileManager.get_user_data_dir('Stable'), 'Local State')
+    
+    @staticmethod
+    def get_profile_directory_by_email(email: str) -> Optional[str]:
+        """Get profile directory name by email"""
+        try:
+            index = ProfileIndex.load()
+            if index is None:
+                return None
+            
+            return index.profile_dir_for(email)
+        except Exception:
+            return None
+    
+    @staticmethod
+    def get_profile_info(email: str) -> Dict:
+        """Get detailed profile information"""
+        try:
+            index = ProfileIndex.load()
+            if index is None:
+                return {}
+            
+            return index.info_for(email)
+        except Exception:
+            return {}
+    
+    @staticmethod
+    def get_emails_from_local_state() -> List[str]:
+        """Get all emails from Chrome Local State (sorted by number, ascending)"""
+        try:
+            index = ProfileIndex.load()
+            if index is None:
+                return []
+            
+            return list(index.emails)
+        except Exception:
+            return []
+
+
+class FileWatcher:
+    """Reports which of a few files changed since the last poll().
+    
+    On Linux an inotify descriptor on the parent directories makes poll()
+    a single non-blocking read (directories, because Chrome and save()
+    both replace files by rename). Elsewhere, or if inotify is
+    unavailable, poll() compares (mtime, size) signatures.
+    """
+    
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_Q_OVERFLOW = 0x4000
+    EVENT_HEADER = 'iIII'
+    
+    def __init__(self, paths: List[str]):
+        self.paths = [p for p in paths if p]
+        self.signatures = {p: self._signature(p) for p in self.paths}
+        self._fd: Optional[int] = None
+        self._watches: Dict[int, str] = {}
+        
+        if sys.platform.startswith('linux'):
+            try:
+                self._start_inotify()
+            except Exception:
+                self.close()
+    
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+    
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _start_inotify(self):
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return
+        self._fd = fd
+        
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+        for directory in {os.path.dirname(os.path.abspath(p)) for p in self.paths}:
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), mask)
+            if wd < 0:
+                # A missing directory can't be watched, poll everything instead
+                raise OSError(ctypes.get_errno(), 'inotify_add_watch failed', directory)
+            self._watches[wd] = directory
+    
+    def _read_events(self) -> List[str]:
+        """Watched paths named by pending inotify events"""
+        wanted = {os.path.abspath(p): p for p in self.paths}
+        header = struct.calcsize(self.EVENT_HEADER)
+        touched = []
+        
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            
+            offset = 0
+            while offset + header <= len(buf):
+                wd, mask, _, length = struct.unpack_from(self.EVENT_HEADER, buf, offset)
+                name = buf[offset + header:offset + header + length].rstrip(b'\0')
+                offset += header + length
+                
+                if mask & self.IN_Q_OVERFLOW:
+                    return list(self.paths)
+                
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                path = wanted.get(os.path.join(directory, os.fsdecode(name)))
+                if path is not None and path not in touched:
+                    touched.append(path)
+        
+        return touched
+    
+    def poll(self) -> List[str]:
+        """Paths whose content changed since the previous poll"""
+        candidates = self._read_events() if self._fd is not None else self.paths
+        
+        changed = []
+        for path in candidates:
+            signature = self._signature(path)
+            if signature != self.signatures.get(path):
+                self.signatures[path] = signature
+                changed.append(path)
+        return changed
+    
+    def close(self):
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = None
+        self._watches = {}
+
+
+class EmailSearchIndex:
+    """Inverted trigram index over emails for substring and digit search"""
+    
+    GRAM_SIZE = 3
+    CANDIDATE_LIMIT = 5000
+    
+    def __init__(self, emails: List[str]):
+        self.emails = list(emails)
+        self.lowered = [e.lower() for e in self.emails]
+        self.positions = {e: i for i, e in enumerate(self.emails)}
+        self.grams: Dict[str, List[int]] = {}
+        self._by_number: Optional[Dict[int, List[int]]] = None
+        self._by_prefix: Optional[List[Tuple[str, int]]] = None
+        
+        grams = self.grams
+        for i, low in enumerate(self.lowered):
+            for gram in self._grams(low):
+                posting = grams.get(gram)
+                if posting is None:
+                    grams[gram] = [i]
+                else:
+                    posting.append(i)
+        
+        # All-digit grams can only come from a digit run, so the digit
+        # posting lists are a filtered view sharing the same lists
+        self.digit_grams: Dict[str, List[int]] = {
+            gram: posting for gram, posting in grams.items() if gram.isdigit()
+        }
+    
+    def _grams(self, text: str) -> set:
+        """All distinct n-grams of text"""
+        n = self.GRAM_SIZE
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+    
+    def _lookup(self, needle: str, table: Dict[str, List[int]]) -> List[int]:
+        """Positions of emails whose lowercase form contains needle"""
+        if len(needle) < self.GRAM_SIZE:
+            # Too short for the gram table, a scan over pre-lowered text is cheap
+            return [i for i, low in enumerate(self.lowered) if needle in low]
+        
+        postings = []
+        for gram in self._grams(needle):
+            posting = table.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        
+        # Grams only prove co-occurrence, confirm the actual substring
+        return sorted(i for i in candidates if needle in self.lowered[i])
+    
+    def __contains__(self, email: str) -> bool:
+        return email in self.positions
+    
+    def __len__(self) -> int:
+        return len(self.emails)
+    
+    def find_substring(self, text: str) -> List[str]:
+        """Emails containing text (case-insensitive), in index order"""
+        return [self.emails[i] for i in self._lookup(text.lower(), self.grams)]
+    
+    def find_digits(self, digits: str, normalized: str) -> List[str]:
+        """Emails containing digits or their zero-stripped form, in index order"""
+        hits = set(self._lookup(digits, self.digit_grams))
+        if normalized != digits:
+            hits.update(self._lookup(normalized, self.digit_grams))
+        return [self.emails[i] for i in sorted(hits)]
+    
+    def positions_for_number(self, number: int) -> List[int]:
+        """Positions of emails whose first number is number (map built on first use)"""
+        if self._by_number is None:
+            by_number: Dict[int, List[int]] = {}
+            for i, email in enumerate(self.emails):
+                match = NUMBER_RE.search(email)
+                if match:
+                    by_number.setdefault(int(match.group()), []).append(i)
+            self._by_number = by_number
+        return self._by_number.get(number, [])
+    
+    def positions_for_prefix(self, prefix: str, limit: int) -> List[int]:
+        """Positions of up to limit emails starting with prefix (sorted copy built on first use)"""
+        if self._by_prefix is None:
+            self._by_prefix = sorted((low, i) for i, low in enumerate(self.lowered))
+        by_prefix = self._by_prefix
+        
+        found = []
+        for j in range(bisect.bisect_left(by_prefix, (prefix, -1)), len(by_prefix)):
+            low, i = by_prefix[j]
+            if not low.startswith(prefix) or len(found) >= limit:
+                break
+            found.append(i)
+        return found
+    
+    def refine_substring(self, previous: List[str], text: str) -> List[str]:
+        """Filter an earlier result set down to emails containing text"""
+        text = text.lower()
+        lowered = self.lowered
+        positions = self.positions
+        return [e for e in previous if text in lowered[positions[e]]]
+    
+    def refine_digits(self, previous: List[str], digits: str, normalized: str) -> List[str]:
+        """Filter an earlier result set down to emails containing the digits"""
+        return [e for e in previous if digits in e or normalized in e]
+    
+    def rank(self, query: str, usage: Dict[str, int], k: int = 50) -> List[str]:
+        """Best k emails for a fuzzy query, highest score first.
+        
+        Candidates are emails whose number is the query's (zero padding
+        ignored) or that start with it, then emails sharing trigrams with
+        the query (or containing it, for queries shorter than a trigram).
+        Scores add trigram overlap, digit match quality, a prefix bonus and
+        usage; only the top k are kept, on a heap, instead of sorting everything.
+        """
+        text = query.strip().lower()
+        if not text:
+            return []
+        
+        digits = ''.join(c for c in text if c.isdigit())
+        number = int(digits) if digits else None
+        emails = self.emails
+        lowered = self.lowered
+        
+        # These get the biggest bonuses whatever their gram overlap, e.g.
+        # '0012' shares no trigram with k12@..., so they always go in first
+        preferred: List[int] = []
+        if number is not None:
+            preferred.extend(self.positions_for_number(number))
+        preferred.extend(self.positions_for_prefix(text, self.CANDIDATE_LIMIT))
+        preferred = list(dict.fromkeys(preferred))[:self.CANDIDATE_LIMIT]
+        
+        # Grams found in most emails (domain parts like 'gma') say nothing
+        # about which email is meant, so they are skipped when others exist
+        postings = sorted((self.grams.get(g, ()) for g in self._grams(text)), key=len)
+        selective = [p for p in postings if 0 < len(p) <= len(self.emails) // 2]
+        postings = selective or [p for p in postings if p]
+        
+        if postings:
+            shared: Dict[int, int] = {}
+            for posting in postings:
+                for i in posting:
+                    shared[i] = shared.get(i, 0) + 1
+            buckets: Dict[int, List[int]] = {}
+            for i, n in shared.items():
+                buckets.setdefault(n, []).append(i)
+            
+            # Score at most CANDIDATE_LIMIT emails, preferred then best
+            # overlap first, so latency stays flat however many emails
+            # share a common gram
+            kept = list(preferred)
+            for n in sorted(buckets, reverse=True):
+                if len(kept) >= self.CANDIDATE_LIMIT:
+                    break
+                kept.extend(buckets[n])
+            overlap = {i: shared.get(i, 0) for i in kept[:self.CANDIDATE_LIMIT]}
+        else:
+            hits = [i for i, low in enumerate(lowered) if text in low]
+            overlap = {i: int(text in lowered[i]) for i in preferred}
+            for i in hits:
+                if len(overlap) >= self.CANDIDATE_LIMIT:
+                    break
+                overlap[i] = 1
+        
+        gram_count = max(len(postings), 1)
+        
+        def score(i: int) -> Tuple[float, int]:
+            low = lowered[i]
+            value = 100.0 * overlap[i] / gram_count
+            if text in low:
+                value += 40
+            if low.startswith(text):
+                value += 30
+            if number is not None:
+                if extract_number_from_email(emails[i]) == number:
+                    value += 60
+                elif digits in low:
+                    value += 20
+            value += min(usage.get(emails[i], 0), 100) * 0.2
+            # Ties keep index (number) order
+            return (value, -i)
+        
+        return [emails[i] for i in heapq.nlargest(k, overlap, key=score)]
+
+
+class SearchResultCache:
+    """LRU of recent query results plus the last result set for refinement.
+    
+    Entries are tagged with the email-list generation, which
+    refresh_profiles bumps, so stale results are never served.
+    """
+    
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._last: Optional[Tuple[int, str, Tuple[str, ...], List[str]]] = None
+    
+    def bump_generation(self):
+        """Invalidate everything cached for the previous email list"""
+        self.generation += 1
+        self._entries.clear()
+        self._last = None
+    
+    def lookup(self, mode: str, needle: Tuple[str, ...], full, refine) -> List[str]:
+        """Serve a query from the LRU, by refining the last results, or in full.
+        
+        Refinement applies when the mode is unchanged and every part of the
+        last needle is contained in the new one (the query grew). Anything
+        else, e.g. a backspace or a mode switch, runs full().
+        """
+        key = (mode, needle)
+        entry = self._entries.get(key)
+        
+        if entry is not None and entry[0] == self.generation:
+            self._entries.move_to_end(key)
+            results = entry[1]
+        else:
+            last = self._last
+            if (last is not None and last[0] == self.generation and last[1] == mode
+                    and all(a in b for a, b in zip(last[2], needle))):
+                results = refine(last[3])
+            else:
+                results = full()
+            
+            self._entries[key] = (self.generation, results)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        
+        self._last = (self.generation, mode, needle, results)
+        return results
+
+
+def build_chrome_args(chrome: str, profile: str, urls: List[str], incognito: bool = False,
+                      new_window: bool = False, debug_port: int = 0) -> List[str]:
+    """One command line that opens all urls in a profile (as tabs, or in a new window)"""
+    args = [chrome, f'--profile-directory={profile}']
+    
+    if incognito:
+        args.append('--incognito')
+    
+    if new_window:
+        args.append('--new-window')
+    
+    if debug_port:
+        args.append(f'--remote-debugging-port={debug_port}')
+    
+    args.extend(urls)
+    return args
+
+
+def spawn_chrome(args: List[str], stderr=None) -> subprocess.Popen:
+    """Start Chrome, hiding the CMD window on Windows"""
+    if sys.platform == 'win32':
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        return subprocess.Popen(args, stderr=stderr, startupinfo=startupinfo)
+    return subprocess.Popen(args, stderr=stderr)
+
+
+def handoff_user_data_dir(channel: Optional[str]) -> Optional[str]:
+    """User data dir whose running browser should take a launch of channel.
+    
+    None (spawn instead) for a custom binary, whose user data dir is unknown.
+    """
+    return ChromeProfileManager.get_user_data_dir(channel) if channel else None
+
+
+def hand_off_to_chrome(user_data_dir: Optional[str], args: List[str], timeout: float = 2.0) -> bool:
+    """Give a command line to the running browser, as a second chrome process would.
+    
+    Chrome's process singleton on Linux/macOS listens on SingletonSocket
+    in the user data dir for 'START\\0<cwd>\\0<argv...>' and answers 'ACK'.
+    Talking to it directly opens the profile/URLs without spawning and
+    tearing down a whole browser process. Returns False (caller spawns)
+    if no browser is listening.
+    """
+    if not user_data_dir or not hasattr(socket, 'AF_UNIX'):
+        return False
+    
+    path = os.path.join(user_data_dir, 'SingletonSocket')
+    if not os.path.lexists(path):
+        return False
+    
+    message = b'\0'.join([b'START', os.fsencode(os.getcwd())] + [os.fsencode(arg) for arg in args])
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(message)
+            sock.shutdown(socket.SHUT_WR)
+            reply = sock.recv(16)
+    except OSError:
+        return False
+    return reply.startswith(b'ACK')
+
+
+class RunningProfileDetector:
+    """Which Chrome profiles are open, from the browser's own footprints.
+    
+    SingletonLock in the user data dir (a symlink to 'host-pid') tells
+    whether a browser is running. If so, the open profiles are the
+    --profile-directory of browser processes in /proc/*/cmdline plus
+    Local State's last_active_profiles. Results are cached for ttl
+    seconds. Without /proc (Windows, macOS) only last_active_profiles
+    of a live browser is used; on Windows nothing is reported.
+    """
+    
+    def __init__(self, user_data_dir: str, ttl: float = 2.0):
+        self.user_data_dir = user_data_dir
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._running: Optional[set] = None
+        self._scanned_at = 0.0
+    
+    def browser_pid(self) -> Optional[int]:
+        """Pid of the live browser owning the user data dir, or None"""
+        try:
+            target = os.readlink(os.path.join(self.user_data_dir, 'SingletonLock'))
+        except (OSError, AttributeError, NotImplementedError):
+            return None
+        
+        host, _, pid = target.rpartition('-')
+        if not pid.isdigit() or host != socket.gethostname():
+            return None
+        
+        try:
+            os.kill(int(pid), 0)
+        except PermissionError:
+            pass
+        except OSError:
+            return None
+        return int(pid)
+    
+    def browser_argv(self) -> Optional[List[str]]:
+        """Command line of the live browser (needs /proc), or None"""
+        pid = self.browser_pid()
+        if pid is None:
+            return None
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                return [os.fsdecode(arg) for arg in f.read().split(b'\0') if arg]
+        except OSError:
+            return None
+    
+    def sole_profile(self) -> Optional[str]:
+        """The one profile the live browser was started with and still only has open.
+        
+        None when that is unknown or other profiles are open too.
+        """
+        argv = self.browser_argv()
+        if argv is None:
+            return None
+        
+        started = [arg[len('--profile-directory='):] for arg in argv if arg.startswith('--profile-directory=')]
+        if len(started) != 1:
+            return None
+        
+        profile = started[0]
+        if not self.running_profiles() <= {profile}:
+            return None
+        return profile
+    
+    def running_profiles(self) -> set:
+        """Profile directories currently open (cached for ttl seconds)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._running is None or now - self._scanned_at > self.ttl:
+                self._running = self._scan()
+                self._scanned_at = now
+            return self._running
+    
+    def invalidate(self):
+        self._running = None
+    
+    def _scan(self) -> set:
+        if self.browser_pid() is None:
+            return set()
+        
+        running = set()
+        if os.path.isdir('/proc'):
+            running.update(self._scan_proc())
+        
+        try:
+            index = ProfileIndex.load(os.path.join(self.user_data_dir, 'Local State'))
+        except Exception:
+            index = None
+        if index is not None:
+            running.update(index.last_active)
+        return running
+    
+    def _scan_proc(self) -> List[str]:
+        """--profile-directory values of browser (not helper) processes"""
+        own_dir = os.path.normpath(self.user_data_dir)
+        profiles = []
+        
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                    argv = f.read().split(b'\0')
+            except OSError:
+                continue
+            
+            if b'chrome' not in os.path.basename(argv[0]).lower():
+                continue
+            
+            profile = None
+            for arg in argv[1:]:
+                if arg.startswith(b'--type='):
+                    # Renderer/GPU/utility helper
+                    profile = None
+                    break
+                if arg.startswith(b'--user-data-dir='):
+                    if os.path.normpath(os.fsdecode(arg[len(b'--user-data-dir='):])) != own_dir:
+                        profile = None
+                        break
+                elif arg.startswith(b'--profile-directory='):
+                    profile = os.fsdecode(arg[len(b'--profile-directory='):])
+            
+            if profile:
+                profiles.append(profile)
+        
+        return profiles
+
+
+def port_is_free(port: int, host: str = '127.0.0.1') -> bool:
+    """True if nothing is bound to host:port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind((host, port))
+        except OSError:
+            return False
+    return True
+
+
+def devtools_active_port(user_data_dir: str) -> Optional[Tuple[int, str]]:
+    """(port, browser target path) from the DevToolsActivePort file.
+    
+    Chrome writes it into its user data dir once the DevTools server is
+    listening, so it names the endpoint that browser really serves.
+    """
+    try:
+        with open(os.path.join(user_data_dir, 'DevToolsActivePort'), 'r', encoding='utf-8') as f:
+            port, _, path = f.read().partition('\n')
+        return int(port), path.strip()
+    except (OSError, ValueError):
+        return None
+
+
+def open_page_count(user_data_dir: str) -> Optional[int]:
+    """Pages open in the browser running in user_data_dir, None if it has no DevTools endpoint"""
+    active = devtools_active_port(user_data_dir)
+    if active is None:
+        return None
+    endpoint = DevToolsEndpoint(active[0])
+    if not endpoint.belongs_to(user_data_dir):
+        return None
+    return endpoint.page_count()
+
+
+def process_tree_rss_mb(root_pid: int) -> Optional[float]:
+    """Resident memory of a process and its descendants in MB (Linux only, else None).
+    
+    Shared pages are counted once per process, so this overestimates a
+    little, which errs on the safe side for a memory budget.
+    """
+    if not root_pid or not os.path.isdir('/proc'):
+        return None
+    
+    children: Dict[int, List[int]] = {}
+    rss_pages: Dict[int, int] = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Fields after "(comm)": state, ppid, ... rss is the 22nd of them
+        fields = stat[stat.rfind(b')') + 2:].split()
+        pid = int(name)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss_pages[pid] = int(fields[21])
+    
+    if root_pid not in rss_pages:
+        return None
+    
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, ()))
+    return total * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+class DevToolsEndpoint:
+    """Chrome's DevTools HTTP endpoint on localhost.
+    
+    Opening a tab is one local HTTP request (PUT /json/new?<url>) instead
+    of a browser process spawn. Chrome serves one endpoint per browser
+    process, on the port given to the launch that started it.
+    """
+    
+    def __init__(self, port: int, host: str = '127.0.0.1', timeout: float = 0.5):
+        self.port = port
+        self.host = host
+        self.timeout = timeout
+    
+    def _request(self, method: str, path: str) -> Optional[Dict]:
+        import http.client
+        
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            conn.request(method, path)
+            response = conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                return None
+            return json.loads(body)
+        except (OSError, ValueError, http.client.HTTPException):
+            return None
+        finally:
+            conn.close()
+    
+    def version(self) -> Optional[Dict]:
+        """GET /json/version, None if nothing (or not DevTools) is listening"""
+        info = self._request('GET', '/json/version')
+        if not isinstance(info, dict) or 'Browser' not in info:
+            return None
+        return info
+    
+    def belongs_to(self, user_data_dir: str) -> bool:
+        """True if the browser answering here is the one running in user_data_dir.
+        
+        Its DevToolsActivePort file must name this port and the same
+        browser target that /json/version reports, so a browser of another
+        user data dir that took the port is not mistaken for it.
+        """
+        active = devtools_active_port(user_data_dir)
+        if active is None or active[0] != self.port or not active[1]:
+            return False
+        
+        info = self.version()
+        if info is None:
+            return False
+        return str(info.get('webSocketDebuggerUrl', '')).endswith(active[1])
+    
+    def open_tab(self, url: str) -> bool:
+        """Open url in a new tab (PUT is required by current Chrome)"""
+        import urllib.parse
+        
+        # Chrome unescapes the query, so encode everything ('#' and '&' included)
+        target = self._request('PUT', '/json/new?' + urllib.parse.quote(url, safe=''))
+        return isinstance(target, dict) and 'id' in target
+    
+    def page_count(self) -> Optional[int]:
+        """Open pages (tabs and windows' documents) from GET /json/list, None if unknown"""
+        targets = self._request('GET', '/json/list')
+        if not isinstance(targets, list):
+            return None
+        return sum(1 for target in targets if isinstance(target, dict) and target.get('type') == 'page')
+
+
+class LaunchJob:
+    """One profile launch: the command lines to spawn and how it went"""
+    
+    def __init__(self, email: str, commands: List[List[str]], incognito: bool = False):
+        self.email = email
+        self.commands = commands
+        self.incognito = incognito
+        self.status = 'pending'  # pending, ok, failed, cancelled, skipped
+        self.error = ''
+        self.elapsed = 0.0
+    
+    def fail(self, error: str) -> 'LaunchJob':
+        """Mark as failed before it is queued (e.g. profile not found)"""
+        self.status = 'failed'
+        self.error = error
+        return self
+    
+    def skip(self, reason: str) -> 'LaunchJob':
+        """Leave out of the batch on purpose (e.g. profile already running)"""
+        self.status = 'skipped'
+        self.error = reason
+        return self
+
+
+class LaunchQueue:
+    """Run LaunchJobs through a bounded worker pool.
+    
+    Jobs are submitted in order, stagger seconds apart, to at most
+    concurrency workers. Every finished job is put on self.events,
+    followed by None once the whole batch is done. cancel() stops every
+    job that has not started yet, including ones already queued in the pool.
+    """
+    
+    def __init__(self, concurrency: int = 4, stagger: float = 0.0, launch=None):
+        self.concurrency = max(1, concurrency)
+        self.stagger = max(0.0, stagger)
+        self.launch = launch or self.spawn
+        self.events: queue.Queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.jobs: List[LaunchJob] = []
+        self.started_at = 0.0
+        self.finished_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+    
+    @staticmethod
+    def spawn(job: LaunchJob):
+        """Default launcher: spawn every command of the job"""
+        for args in job.commands:
+            spawn_chrome(args)
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self, jobs: List[LaunchJob]):
+        """Launch jobs in the background"""
+        self.jobs = list(jobs)
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name='launch-queue', daemon=True)
+        self._thread.start()
+    
+    def cancel(self):
+        """Skip jobs that have not started yet"""
+        self.cancel_event.set()
+    
+    def wait(self, timeout: Optional[float] = None):
+        """Block until the batch is done (CLI use)"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+    
+    def count(self, status: str) -> int:
+        return sum(1 for job in self.jobs if job.status == status)
+    
+    def throughput(self) -> float:
+        """Successful launches per second so far"""
+        end = self.finished_at or time.monotonic()
+        elapsed = end - self.started_at
+        return self.count('ok') / elapsed if elapsed > 0 else 0.0
+    
+    def _run(self):
+        """Coordinator thread: feed the pool, honouring stagger and cancel"""
+        submitted = 0
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='launch') as pool:
+            for job in self.jobs:
+                if job.status != 'pending':
+                    self.events.put(job)
+                    continue
+                
+                if submitted and self.stagger:
+                    self.cancel_event.wait(self.stagger)
+                
+                if self.cancel_event.is_set():
+                    job.status = 'cancelled'
+                    self.events.put(job)
+                    continue
+                
+                pool.submit(self._launch_one, job)
+                submitted += 1
+        
+        self.finished_at = time.monotonic()
+        self.events.put(None)
+    
+    def _launch_one(self, job: LaunchJob):
+        """Worker body"""
+        if self.cancel_event.is_set():
+            # Queued in the pool before cancel() but not started
+            job.status = 'cancelled'
+            self.events.put(job)
+            return
+        
+        start = time.monotonic()
+        try:
+            self.launch(job)
+            job.status = 'ok'
+        except Exception as e:
+            job.status = 'failed'
+            job.error = str(e)
+        job.elapsed = time.monotonic() - start
+        self.events.put(job)
+
+
+class ProcessSupervisor:
+    """Track spawned Chrome processes by profile and reap them when they exit.
+    
+    stderr is drained by a reader thread per child that keeps only the
+    last STDERR_TAIL bytes, so a long-lived browser can neither block on
+    a full pipe nor grow a log without bound. One waiter thread polls the tracked
+    children (waitpid on those pids only, never on other subprocesses),
+    so no zombies are left behind. Every exit is logged; a non-zero exit
+    also logs the stderr tail, and is put on self.failures for the UI.
+    """
+    
+    POLL_INTERVAL = 0.5
+    STDERR_TAIL = 2048
+    
+    def __init__(self, logger=None):
+        self.logger = logger
+        self.failures: queue.Queue = queue.Queue()
+        self._children: Dict[int, Tuple[str, subprocess.Popen, Tuple[threading.Thread, bytearray], float]] = {}
+        self._lock = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+    
+    def spawn(self, args: List[str], email: str = '') -> subprocess.Popen:
+        """Start Chrome for a profile and supervise it"""
+        process = spawn_chrome(args, stderr=subprocess.PIPE)
+        tail = bytearray()
+        reader = threading.Thread(
+            target=self._drain, args=(process.stderr, tail), name='chrome-stderr', daemon=True
+        )
+        reader.start()
+        
+        with self._lock:
+            self._children[process.pid] = (email, process, (reader, tail), time.monotonic())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='process-supervisor', daemon=True)
+                self._thread.start()
+            self._lock.notify()
+        return process
+    
+    def running(self, email: str) -> List[int]:
+        """Pids of supervised processes for a profile that have not exited"""
+        with self._lock:
+            return [pid for pid, child in self._children.items() if child[0] == email]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._children)
+    
+    @classmethod
+    def _drain(cls, stream, tail: bytearray):
+        """Reader thread: keep the last STDERR_TAIL bytes of a child's stderr"""
+        try:
+            fd = stream.fileno()
+            while True:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break
+                tail += chunk
+                del tail[:-cls.STDERR_TAIL]
+        except (OSError, ValueError):
+            pass
+        finally:
+            stream.close()
+    
+    def _run(self):
+        """Waiter thread: reap exited children"""
+        while True:
+            with self._lock:
+                while not self._children and not self._closed:
+                    self._lock.wait()
+                if self._closed:
+                    return
+                children = list(self._children.items())
+            
+            for pid, (email, process, stderr_reader, started) in children:
+                if process.poll() is None:
+                    continue
+                with self._lock:
+                    self._children.pop(pid, None)
+                self._report(email, process, stderr_reader, time.monotonic() - started)
+            
+            with self._lock:
+                if not self._closed:
+                    self._lock.wait(self.POLL_INTERVAL)
+    
+    def _report(self, email: str, process: subprocess.Popen, stderr_reader, elapsed: float):
+        """Log one exit; failures also go to self.failures"""
+        code = process.returncode
+        reader, tail_bytes = stderr_reader
+        # Renderers that outlive the browser may hold the pipe open; don't wait on them
+        reader.join(1.0)
+        tail = bytes(tail_bytes).decode('utf-8', 'replace').strip()
+        
+        if self.logger is not None:
+            self.logger.write(f'Chrome exited: email={email}, pid={process.pid}, code={code}, after {elapsed:.1f}s')
+            if code != 0 and tail:
+                self.logger.write(f'Chrome stderr ({email}): {tail}')
+        
+        if code != 0:
+            self.failures.put((email, code, tail.splitlines()[-1] if tail else ''))
+    
+    def close(self):
+        """Stop the waiter; running browsers are left alone"""
+        with self._lock:
+            self._closed = True
+            self._lock.notify()
+            self._children.clear()
+
+
+class LaunchTimer:
+    """Marks along one launch, from the click to a usable browser.
+    
+    Each phase's span runs from the previous mark (or the start) to its
+    own mark: resolve (Chrome path), profile (Local State lookup),
+    spawn (launch/hand-off call) and ready.
+    """
+    
+    def __init__(self, email: str):
+        self.email = email
+        self.started = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+    
+    def mark(self, phase: str):
+        self.marks.append((phase, time.perf_counter()))
+    
+    def spans_ms(self) -> Dict[str, float]:
+        spans = {}
+        previous = self.started
+        for phase, at in self.marks:
+            spans[phase] = (at - previous) * 1000
+            previous = at
+        return spans
+    
+    def total_ms(self) -> float:
+        end = self.marks[-1][1] if self.marks else self.started
+        return (end - self.started) * 1000
+
+
+class ReadyWatcher:
+    """Waits off the Tk thread until launched browsers are usable.
+    
+    A launch is ready once its check() returns True, e.g. the DevTools
+    endpoint answers or the browser's singleton appears in the user data
+    dir. Finished timers go to self.done as (timer, ready); launches not
+    ready within timeout seconds are reported with ready=False.
+    """
+    
+    INTERVAL = 0.025
+    
+    def __init__(self, timeout: float = 30.0):
+        self.timeout = timeout
+        self.done: queue.Queue = queue.Queue()
+        self._pending: List[Tuple[LaunchTimer, object, float]] = []
+        self._lock = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+    
+    def watch(self, timer: LaunchTimer, check):
+        with self._lock:
+            self._pending.append((timer, check, time.monotonic() + self.timeout))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='ready-watcher', daemon=True)
+                self._thread.start()
+            self._lock.notify()
+    
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._lock.wait()
+                if self._closed:
+                    return
+                pending = list(self._pending)
+            
+            now = time.monotonic()
+            for entry in pending:
+                timer, check, deadline = entry
+                try:
+                    ready = bool(check())
+                except Exception:
+                    ready = False
+                
+                if ready:
+                    timer.mark('ready')
+                elif now < deadline:
+                    continue
+                
+                with self._lock:
+                    self._pending.remove(entry)
+                self.done.put((timer, ready))
+            
+            with self._lock:
+                if not self._closed:
+                    self._lock.wait(self.INTERVAL)
+    
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+            self._lock.notify()
+
+
+class LatencyStats:
+    """Per-profile launch-to-ready latency histograms, kept in a JSON file"""
+    
+    # Upper bucket bounds in ms; the last bucket counts everything slower
+    BUCKETS_MS = [100, 250, 500, 1000, 2000, 5000, 10000, 30000]
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.profiles: Dict[str, Dict] = {}
+        self.dirty = False
+    
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                profiles = json.load(f).get('profiles', {})
+        except (OSError, ValueError, AttributeError):
+            return
+        if isinstance(profiles, dict):
+            self.profiles = profiles
+    
+    def save(self):
+        """Write if changed (atomic replace)"""
+        if not self.dirty:
+            return
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'buckets_ms': self.BUCKETS_MS, 'profiles': self.profiles}, f, indent=1)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+    
+    def _entry(self, email: str) -> Dict:
+        return self.profiles.setdefault(email, {
+            'count': 0, 'timeouts': 0, 'handoffs': 0, 'sum_ms': 0.0, 'max_ms': 0.0, 'last_ms': 0.0,
+            'histogram': [0] * (len(self.BUCKETS_MS) + 1), 'phase_sum_ms': {}
+        })
+    
+    def record(self, email: str, spans_ms: Dict[str, float], total_ms: Optional[float]):
+        """Add one launch; total_ms None means it never became ready"""
+        entry = self._entry(email)
+        
+        for phase, ms in spans_ms.items():
+            entry['phase_sum_ms'][phase] = round(entry['phase_sum_ms'].get(phase, 0.0) + ms, 1)
+        
+        if total_ms is None:
+            entry['timeouts'] += 1
+        else:
+            entry['count'] += 1
+            entry['sum_ms'] = round(entry['sum_ms'] + total_ms, 1)
+            entry['max_ms'] = round(max(entry['max_ms'], total_ms), 1)
+            entry['last_ms'] = round(total_ms, 1)
+            entry['histogram'][bisect.bisect_left(self.BUCKETS_MS, total_ms)] += 1
+        self.dirty = True
+    
+    def record_handoff(self, email: str):
+        """Count a launch a running browser took over; it has no ready time of its own"""
+        entry = self._entry(email)
+        entry['handoffs'] = entry.get('handoffs', 0) + 1
+        self.dirty = True
+    
+    def percentile_bound(self, email: str, fraction: float) -> Optional[int]:
+        """Bucket bound under which fraction of launches became ready (None = slowest bucket)"""
+        entry = self.profiles.get(email)
+        if not entry or not entry['count']:
+            return None
+        
+        needed = fraction * entry['count']
+        seen = 0
+        for bound, count in zip(self.BUCKETS_MS, entry['histogram']):
+            seen += count
+            if seen >= needed:
+                return bound
+        return None
+    
+    def slowest(self, k: int = 10) -> List[Tuple[str, float, int]]:
+        """(email, mean ms, launches) of the k profiles with the highest mean"""
+        means = [
+            (email, entry['sum_ms'] / entry['count'], entry['count'])
+            for email, entry in self.profiles.items() if entry['count']
+        ]
+        return heapq.nlargest(k, means, key=lambda item: item[1])
+
+
+class WarmPool:
+    """Profiles kept loaded in a windowless browser so opening them is quick.
+    
+    Candidates are ranked by usage count, recents and how often each was
+    opened around the current hour (history kept in a small JSON file).
+    Chrome runs every profile of a user data dir in one browser process,
+    so the memory budget applies to that process tree: when it is over,
+    the least recently used profile leaves the pool and capacity shrinks
+    until memory is back under budget.
+    """
+    
+    def __init__(self, path: str, size: int = 6, budget_mb: int = 3072):
+        self.path = path
+        self.size = size
+        self.capacity = size
+        self.budget_mb = budget_mb
+        self.hours: Dict[str, List[int]] = {}
+        self.warm: OrderedDict = OrderedDict()  # email -> warmed at, LRU first
+        self.owned_pid = 0  # browser started by the pool itself, still never seen with a page
+        self.dirty = False
+    
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                hours = json.load(f).get('hours', {})
+        except (OSError, ValueError, AttributeError):
+            return
+        if isinstance(hours, dict):
+            self.hours = {
+                email: counts for email, counts in hours.items()
+                if isinstance(counts, list) and len(counts) == 24
+            }
+    
+    def save(self):
+        """Write if changed (atomic replace)"""
+        if not self.dirty:
+            return
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'hours': self.hours}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+    
+    def record_open(self, email: str, hour: Optional[int] = None):
+        """Count an open at this hour and make the profile most recently used"""
+        if hour is None:
+            hour = datetime.now().hour
+        self.hours.setdefault(email, [0] * 24)[hour] += 1
+        if email in self.warm:
+            self.warm.move_to_end(email)
+        self.dirty = True
+    
+    def rank(self, usage: Dict[str, int], recents: List[str], present=None,
+             hour: Optional[int] = None) -> List[str]:
+        """Up to capacity emails most likely to be opened next"""
+        if hour is None:
+            hour = datetime.now().hour
+        
+        top_usage = max(usage.values(), default=0) or 1
+        recent_rank = {email: i for i, email in enumerate(recents)}
+        
+        def score(email: str) -> float:
+            value = usage.get(email, 0) / top_usage
+            if email in recent_rank:
+                value += 0.5 * (1 - recent_rank[email] / len(recents))
+            counts = self.hours.get(email)
+            if counts:
+                opens = sum(counts)
+                # This hour and its neighbours, trusted once there is some history
+                near = counts[hour - 1] + counts[hour] + counts[(hour + 1) % 24]
+                value += near / opens * min(1.0, opens / 10)
+            return value
+        
+        candidates = set(usage) | set(recent_rank) | set(self.hours)
+        if present is not None:
+            candidates = {email for email in candidates if email in present}
+        
+        ranked = heapq.nlargest(self.capacity, candidates, key=score)
+        return [email for email in ranked if score(email) > 0]
+    
+    def mark_warm(self, email: str):
+        self.warm[email] = time.time()
+        self.warm.move_to_end(email)
+        while len(self.warm) > self.capacity:
+            self.warm.popitem(last=False)
+    
+    def over_budget(self, rss_mb: Optional[float]) -> bool:
+        return rss_mb is not None and bool(self.budget_mb) and rss_mb > self.budget_mb
+    
+    def check_budget(self, rss_mb: Optional[float]) -> Optional[str]:
+        """Shrink the pool when over budget; returns the evicted email, if any"""
+        if rss_mb is None or not self.budget_mb:
+            return None
+        
+        if not self.over_budget(rss_mb):
+            # Grow back slowly once there is clear headroom
+            if rss_mb < 0.75 * self.budget_mb and self.capacity < self.size:
+                self.capacity += 1
+            return None
+        
+        self.capacity = max(0, min(self.capacity, len(self.warm)) - 1)
+        if self.warm:
+            return self.warm.popitem(last=False)[0]
+        return None
+
+
+class Logger:
+    """Simple logger.
+    
+    In buffered mode write() only enqueues the line. A background thread
+    appends batches to the file when flush_bytes have built up or every
+    flush_interval seconds, so callers never pay for open/close. With
+    max_bytes set the file is rotated to .1 .. .N (backups) when it grows
+    past that size.
+    """
+    
+    def __init__(self, log_path: str, buffered: bool = False, max_bytes: int = 0, backups: int = 3,
+                 flush_interval: float = 1.0, flush_bytes: int = 64 * 1024):
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.flush_bytes = min(flush_bytes, max_bytes) if max_bytes else flush_bytes
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        
+        if buffered:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+    
+    def write(self, msg: str):
+        """Write log message"""
+        try:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            line = f"[{timestamp}] {msg}\n"
+            
+            if self._queue is not None:
+                self._queue.put(line)
+            else:
+                self._append([line])
+        except Exception:
+            pass
+    
+    def close(self):
+        """Flush everything queued and stop the writer thread"""
+        if self._queue is None or self._thread is None:
+            return
+        
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        self._queue = None
+        self._thread = None
+    
+    def _run(self):
+        """Writer thread: batch lines and flush on size, time or close"""
+        pending: List[str] = []
+        pending_bytes = 0
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                line = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                line = ''
+            
+            if line:
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(line)
+                pending_bytes += len(line)
+                if pending_bytes < self.flush_bytes and time.monotonic() < deadline:
+                    continue
+            
+            if pending:
+                try:
+                    self._append(pending)
+                except Exception:
+                    pass
+                pending = []
+                pending_bytes = 0
+                deadline = None
+            
+            if line is None:
+                return
+    
+    def _append(self, lines: List[str]):
+        """Append lines with one open/close per file, rotating whenever the next line would not fit.
+        
+        A single line longer than max_bytes still goes whole into a fresh file.
+        """
+        if not self.max_bytes:
+            self._write(lines)
+            return
         
-        for channel in ['Stable', 'Beta', 'Dev', 'Canary']:
-            path = ChromePathFinder.get_chrome_path_for_channel(channel)
-            if path:
-                return path
+        try:
+            size = os.path.getsize(self.log_path)
+        except OSError:
+            size = 0
+        
+        chunk: List[str] = []
+        for line in lines:
+            length = len(line.encode('utf-8'))
+            if size and size + length > self.max_bytes:
+                self._write(chunk)
+                chunk = []
+                try:
+                    self._rotate()
+                except OSError:
+                    pass
+                size = 0
+            chunk.append(line)
+            size += length
+        self._write(chunk)
+    
+    def _write(self, lines: List[str]):
+        if lines:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+    
+    def _rotate(self):
+        """log -> log.1 -> ... -> log.N, dropping the oldest"""
+        if self.backups <= 0:
+            os.remove(self.log_path)
+            return
         
-        return None
+        for i in range(self.backups - 1, 0, -1):
+            src = f'{self.log_path}.{i}'
+            if os.path.exists(src):
+                os.replace(src, f'{self.log_path}.{i + 1}')
+        os.replace(self.log_path, f'{self.log_path}.1')
 
 
-class ChromeProfileManager:
-    """Manage Chrome profiles"""
+def instance_socket_path() -> Optional[str]:
+    """Unix socket of the running GUI for this install.
     
-    @staticmethod
-    def get_local_state_path() -> str:
-        """Get path to Chrome Local State file"""
-        if sys.platform == 'win32':
-            local_appdata = os.environ.get('LOCALAPPDATA', '')
-            return os.path.join(local_appdata, 'Google', 'Chrome', 'User Data', 'Local State')
-        elif sys.platform == 'darwin':
-            home = os.path.expanduser('~')
-            return os.path.join(home, 'Library', 'Application Support', 'Google', 'Chrome', 'Local State')
-        else:
-            home = os.path.expanduser('~')
-            return os.path.join(home, '.config', 'google-chrome', 'Local State')
+    Lives in a 0700 directory of the current user. None without AF_UNIX
+    (e.g. Windows) or if that directory was taken over by another user.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
     
-    @staticmethod
-    def get_profile_directory_by_email(email: str) -> Optional[str]:
-        """Get profile directory name by email"""
+    uid = os.getuid()
+    try:
+        runtime_dir = private_dir(os.environ.get('XDG_RUNTIME_DIR') or '/tmp', f'chrome_launcher_{uid}')
+    except OSError:
+        return None
+    tag = zlib.crc32(SCRIPT_DIR.encode('utf-8'))
+    return os.path.join(runtime_dir, f'instance_{tag:08x}.sock')
+
+
+def owned_socket(path: str) -> bool:
+    """True if path is a socket that belongs to the current user"""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def forward_to_instance(request: Dict, timeout: float = 5.0) -> Optional[Dict]:
+    """Hand a request to the running GUI, returns its reply or None if none is listening"""
+    path = instance_socket_path()
+    if path is None or not owned_socket(path):
+        return None
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
         try:
-            local_state_path = ChromeProfileManager.get_local_state_path()
-            if not os.path.exists(local_state_path):
-                return None
-            
-            with open(local_state_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            cache = data.get('profile', {}).get('info_cache', {})
-            
-            for profile_dir, profile_info in cache.items():
-                gaia_email = profile_info.get('gaia_info', {}).get('email', '')
-                user_name = profile_info.get('user_name', '')
-                
-                if gaia_email == email or user_name == email:
-                    return profile_dir
-            
-            return None
-        except Exception:
+            sock.connect(path)
+        except OSError:
+            # Stale socket file, nobody is listening
             return None
+        
+        try:
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            reply = sock.makefile('rb').readline()
+            return json.loads(reply)
+        except (OSError, ValueError):
+            # Delivered but unanswered: don't launch a second time locally
+            return {'ok': False, 'message': 'Error: running launcher did not answer'}
+
+
+class InstanceServer:
+    """Socket the first GUI listens on so later runs forward their request to it.
     
-    @staticmethod
-    def get_profile_info(email: str) -> Dict:
-        """Get detailed profile information"""
+    Each connection carries one JSON request line. Requests are queued
+    for the Tk thread, which answers through respond().
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.requests: queue.Queue = queue.Queue()
+        self._sock: Optional[socket.socket] = None
+    
+    def start(self) -> bool:
+        """Listen, unless another live instance already does"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            local_state_path = ChromeProfileManager.get_local_state_path()
-            if not os.path.exists(local_state_path):
-                return {}
-            
-            with open(local_state_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            try:
+                sock.bind(self.path)
+            except OSError:
+                if not owned_socket(self.path):
+                    # Not ours to reuse or remove
+                    sock.close()
+                    return False
+                if forward_to_instance({'action': 'ping'}, timeout=1.0) is not None:
+                    sock.close()
+                    return False
+                os.unlink(self.path)
+                sock.bind(self.path)
             
-            cache = data.get('profile', {}).get('info_cache', {})
+            os.chmod(self.path, 0o600)
+            sock.listen(8)
+        except OSError:
+            sock.close()
+            return False
+        
+        self._sock = sock
+        threading.Thread(target=self._serve, name='instance-server', daemon=True).start()
+        return True
+    
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
             
-            for profile_dir, profile_info in cache.items():
-                gaia_email = profile_info.get('gaia_info', {}).get('email', '')
-                user_name = profile_info.get('user_name', '')
-                
-                if gaia_email == email or user_name == email:
-                    return {
-                        'email': email,
-                        'name': profile_info.get('name', ''),
-                        'profile_dir': profile_dir,
-                        'user_name': user_name,
-                        'gaia_name': profile_info.get('gaia_info', {}).get('given_name', '')
-                    }
+            try:
+                conn.settimeout(5)
+                request = json.loads(conn.makefile('rb').readline(64 * 1024))
+                if not isinstance(request, dict):
+                    raise ValueError('request must be an object')
+            except (OSError, ValueError):
+                conn.close()
+                continue
             
-            return {}
-        except Exception:
-            return {}
+            self.requests.put((request, conn))
     
     @staticmethod
-    def get_emails_from_local_state() -> List[str]:
-        """Get all emails from Chrome Local State"""
+    def respond(conn: socket.socket, ok: bool, message: str):
+        """Answer one request and close its connection"""
         try:
-            local_state_path = ChromeProfileManager.get_local_state_path()
-            if not os.path.exists(local_state_path):
-                return []
-            
-            with open(local_state_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            cache = data.get('profile', {}).get('info_cache', {})
-            emails = []
-            
-            for profile_dir, profile_info in cache.items():
-                gaia_email = profile_info.get('gaia_info', {}).get('email', '')
-                user_name = profile_info.get('user_name', '')
-                
-                if gaia_email:
-                    emails.append(gaia_email)
-                elif user_name:
-                    emails.append(user_name)
-            
-            emails = [e for e in emails if '@' in e]
-            emails = list(set(emails))
-            
-            # Sort by number (ascending)
-            emails = sort_emails_by_number(emails)
-            
-            return emails
-        except Exception:
-            return []
+            conn.sendall(json.dumps({'ok': ok, 'message': message}).encode('utf-8') + b'\n')
+        except OSError:
+            pass
+        finally:
+            conn.close()
+    
+    def close(self):
+        if self._sock is None:
+            return
+        try:
+            # Wakes the accept() in _serve
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._sock = None
+        if owned_socket(self.path):
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
 
 
-class Logger:
-    """Simple logger"""
+class VirtualListView:
+    """Listbox fed in bulk through a listvariable.
     
-    def __init__(self, log_path: str):
-        self.log_path = log_path
+    The first screenful is pushed at once so the list paints immediately;
+    the full row set follows in a single Tcl call when Tk is idle. Row
+    text stays in Python, so lookups never round-trip through Tcl.
+    """
     
-    def write(self, msg: str):
-        """Write log message"""
-        try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            with open(self.log_path, 'a', encoding='utf-8') as f:
-                f.write(f"[{timestamp}] {msg}\n")
-        except Exception:
-            pass
+    FIRST_PAINT_ROWS = 200
+    
+    def __init__(self, listbox: 'tk.Listbox', variable: 'tk.Variable', key=None,
+                 mark_color: str = '#3CB371'):
+        self.listbox = listbox
+        self.variable = variable
+        self.items: List[str] = []
+        # Rows whose key(text) is in marked get mark_color (e.g. running profiles)
+        self.key = key or (lambda text: text)
+        self.marked: set = set()
+        self.mark_color = mark_color
+        self._painted: List[int] = []
+        self._fill_id = None
+    
+    def set_items(self, items: List[str], select_first: bool = False):
+        """Replace all rows"""
+        if self._fill_id is not None:
+            self.listbox.after_cancel(self._fill_id)
+            self._fill_id = None
+        
+        self._unpaint()
+        self.items = list(items)
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.yview_moveto(0)
+        
+        head = self.items[:self.FIRST_PAINT_ROWS]
+        self.variable.set(tuple(head))
+        self._paint(0, len(head))
+        if len(self.items) > len(head):
+            # Queued after the redraw Tk just scheduled, so the head paints first
+            self._fill_id = self.listbox.after_idle(self._fill)
+        
+        if select_first and self.items:
+            self.listbox.selection_set(0)
+    
+    def _fill(self):
+        self._fill_id = None
+        self.variable.set(tuple(self.items))
+        self._paint(self.FIRST_PAINT_ROWS, len(self.items))
+    
+    def set_marked(self, keys):
+        """Colour the rows whose key is in keys (only those rows are touched)"""
+        self._unpaint()
+        self.marked = set(keys)
+        loaded = len(self.items) if self._fill_id is None else min(len(self.items), self.FIRST_PAINT_ROWS)
+        self._paint(0, loaded)
+    
+    def _paint(self, start: int, end: int):
+        if not self.marked:
+            return
+        key = self.key
+        marked = self.marked
+        for i in range(start, end):
+            if key(self.items[i]) in marked:
+                self.listbox.itemconfig(i, fg=self.mark_color)
+                self._painted.append(i)
+    
+    def _unpaint(self):
+        size = self.listbox.size()
+        for i in self._painted:
+            if i < size:
+                self.listbox.itemconfig(i, fg='')
+        self._painted = []
+    
+    def clear(self):
+        self.set_items([])
+    
+    def size(self) -> int:
+        return len(self.items)
+    
+    def get(self, index: int) -> str:
+        return self.items[index]
+    
+    def curselection(self) -> Tuple[int, ...]:
+        return self.listbox.curselection()
+    
+    def selected(self) -> List[str]:
+        """Text of every selected row"""
+        return [self.items[i] for i in self.listbox.curselection() if i < len(self.items)]
+    
+    def select(self, index: int):
+        """Select a single row and scroll it into view"""
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
 
 
 class URLEntryDialog:
@@ -740,41 +3387,61 @@ class UpdateDialog:
 class ChromeLauncherUI:
     """Main UI for Chrome Launcher"""
     
-    def __init__(self, cli_args=None):
-        self.cli_args = cli_args
+    SEARCH_MODES = ['Exact', 'Fuzzy', 'Regex']
+    
+    def __init__(self):
+        _load_tk()
         
         # Setup paths
-        self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.config_path = os.path.join(self.script_dir, 'ChromeLauncherUI.cfg')
-        self.log_path = os.path.join(self.script_dir, 'ChromeLauncherUI.log')
+        self.script_dir = SCRIPT_DIR
+        self.config_path = CONFIG_FILE
+        self.log_path = LOG_FILE
         
         # Initialize components
         self.config = ChromeLauncherConfig(self.config_path)
         self.config.load()
-        self.logger = Logger(self.log_path)
-        self.emails = ChromeProfileManager.get_emails_from_local_state()
-        self.updater = AutoUpdater(VERSION, UPDATE_CHECK_URL, DOWNLOAD_URL)
+        self.logger = Logger(
+            self.log_path,
+            buffered=self.config.log_buffered == '1',
+            max_bytes=int(self.config.log_max_kb) * 1024,
+            backups=int(self.config.log_backups)
+        )
+        self.emails = SortedEmailList(ChromeProfileManager.get_emails_from_local_state())
+        self.chrome_registry = ChromeInstallRegistry()
+        self.supervisor = ProcessSupervisor(self.logger)
+        self.local_state_path = ChromeProfileManager.get_local_state_path()
+        self.user_data_dir = os.path.dirname(self.local_state_path)
+        self.running_detector = RunningProfileDetector(self.user_data_dir)
+        self.running_emails: set = set()
+        self.running_queue: queue.Queue = queue.Queue()
+        self.channel_versions: Dict[str, str] = {}
+        self.latency = LatencyStats(os.path.join(self.script_dir, 'ChromeLauncherUI.latency.json'))
+        self.latency.load()
+        self.ready_watcher = ReadyWatcher()
+        self.latency_save_id = None
+        self.warm_pool = WarmPool(
+            os.path.join(self.script_dir, 'ChromeLauncherUI.warm.json'),
+            int(self.config.warm_pool_size or 6), int(self.config.warm_pool_budget_mb or 0)
+        )
+        self.warm_pool.load()
+        self.warm_queue: Optional[LaunchQueue] = None
+        self.warm_scan_queue: queue.Queue = queue.Queue()
+        self.updater = AutoUpdater(
+            VERSION, UPDATE_CHECK_URL, DOWNLOAD_URL,
+            os.path.join(self.script_dir, 'ChromeLauncherUI.update.json')
+        )
         
         # Default URLs
-        self.default_urls = {
-            '1': 'https://www.youtube.com/paid_memberships?ybp=mAEK',
-            '2': 'https://myaccount.google.com/family/details',
-            '3': 'https://www.netflix.com/account',
-            '4': 'https://mail.google.com/mail/u/0/?tab=rm&ogbl#inbox',
-            '5': 'https://www.apps.disneyplus.com/th/home',
-            '6': 'primevideo.com/-/th/signup',
-            # '7': 'https://media.tenor.com/QpIBfnIvRLcAAAAj/i-love-you-love.gif'
-            '7': 'https://auth.hbomax.com/login'
-        }
+        self.default_urls = dict(DEFAULT_URLS)
         
-        # Handle CLI mode
-        if cli_args and cli_args.email:
-            self.launch_from_cli()
-            return
+        self.search_index = EmailSearchIndex(self.emails)
+        self.search_cache = SearchResultCache()
+        self.version_queue: queue.Queue = queue.Queue()
         
         # Create UI
         self.root = tk.Tk()
         self.root.title(f'Chrome Profile Launcher v{VERSION}')
+        self.config.set_scheduler(self.root.after, self.root.after_cancel)
         
         # Apply theme
         self.apply_theme(self.config.theme)
@@ -794,25 +3461,117 @@ class ChromeLauncherUI:
         # Auto-search timer
         self.search_timer = None
         
+        # Batch launches
+        self.batch: Optional[LaunchQueue] = None
+        
+        # Background update checks
+        self.update_worker = UpdateCheckWorker(self.updater)
+        self.update_poll_id = None
+        self.download_queue: queue.Queue = queue.Queue()
+        self.download_thread: Optional[threading.Thread] = None
+        
         # Populate initial data
         self.populate_fav_list()
         self.update_quick_launch_buttons()
         
+        # Show detected Chrome versions in the channel selector
+        self.probe_chrome_versions()
+        
+        # Pick up new profiles and cfg edits by other launchers without F5
+        self.start_watching()
+        
+        # Later runs (GUI or --email) hand their request to this instance
+        self.start_instance_server()
+        
+        # Report Chrome processes that exit with an error
+        self.root.after(500, self.poll_supervisor)
+        
+        # Launch-to-ready timings
+        self.root.after(100, self.poll_ready)
+        
+        # Opt-in: keep the likeliest profiles loaded in a windowless browser
+        if self.config.warm_pool == '1':
+            if os.path.isdir('/proc'):
+                self.root.after(5000, self.refresh_warm_pool)
+            else:
+                # Without a memory reading the budget could not be enforced
+                self.logger.write('Warm pool: disabled, browser memory cannot be measured on this platform')
+        
+        # Mark profiles that are already open
+        self.poll_running_profiles()
+        
         # Check for updates (only if URLs are configured)
         if self.config.auto_update_check == '1' and UPDATE_CHECK_URL and UPDATE_CHECK_URL.strip():
             self.root.after(1000, self.check_for_updates_async)
     
     def check_for_updates_async(self):
         """Check for updates asynchronously"""
+        if not self.update_check_due():
+            # Checked recently, reuse the cached version.json instead of the network
+            update_info = self.updater.cached_update_info()
+            if update_info:
+                self.show_update_dialog(update_info)
+            return
+        
+        self.request_update_check('auto')
+    
+    def update_check_due(self) -> bool:
+        """True if LAST_UPDATE_CHECK is older than UPDATE_CHECK_INTERVAL hours"""
         try:
-            update_info = self.updater.check_for_updates()
+            interval = int(self.config.update_check_interval)
+            last = datetime.fromisoformat(self.config.last_update_check)
+        except ValueError:
+            return True
+        
+        return (datetime.now() - last).total_seconds() >= interval * 3600
+    
+    def request_update_check(self, source: str):
+        """Start (or join) a background update check and poll for its result"""
+        self.update_worker.request(source)
+        
+        if self.update_poll_id is None:
+            self.update_poll_id = self.root.after(100, self.poll_update_check)
+    
+    def poll_update_check(self):
+        """Pick up finished update checks on the Tk thread"""
+        self.update_poll_id = None
+        
+        try:
+            sources, update_info, error = self.update_worker.results.get_nowait()
+        except queue.Empty:
+            self.update_poll_id = self.root.after(100, self.poll_update_check)
+            return
+        
+        if self.update_worker.busy or not self.update_worker.results.empty():
+            self.update_poll_id = self.root.after(100, self.poll_update_check)
+        
+        manual = 'manual' in sources
+        
+        if manual:
+            try:
+                self.status_label.config(text='')
+            except Exception:
+                pass
+        
+        if error is not None:
+            label = 'Manual update check' if manual else 'Update check'
+            self.logger.write(f'{label} failed: {str(error)}')
+            if manual:
+                messagebox.showerror('Update Check Failed', 'Could not check for updates.\nPlease check your internet connection.')
+            return
+        
+        try:
+            # Only a successful check postpones the next one
+            self.config.last_update_check = datetime.now().isoformat()
+            self.config.mark_dirty()
             
             if update_info:
                 self.show_update_dialog(update_info)
-            
-            # Update last check time
-            self.config.last_update_check = datetime.now().isoformat()
-            self.config.save()
+            elif manual:
+                messagebox.showinfo(
+                    'No Updates',
+                    f'You are running the latest version (v{VERSION})'
+                )
         except Exception as e:
             self.logger.write(f'Update check failed: {str(e)}')
     
@@ -825,23 +3584,65 @@ class ChromeLauncherUI:
             self.perform_update(update_info)
     
     def perform_update(self, update_info: Dict):
-        """Perform the update"""
+        """Download the update in the background, then install it"""
+        if self.download_thread is not None and self.download_thread.is_alive():
+            self.status_label.config(text='Update download already in progress...')
+            return
+        
+        download_url = update_info.get('download_url', DOWNLOAD_URL)
+        expected_sha256 = update_info.get('sha256', '')
+        if not expected_sha256:
+            self.logger.write('Update has no sha256 in version.json, not installing')
+            messagebox.showerror(
+                'Update Failed',
+                'This release has no sha256 checksum in version.json, so it cannot be verified.'
+            )
+            return
+        
+        def progress(done, total, rate):
+            self.download_queue.put(('progress', (done, total, rate)))
+        
+        def worker():
+            temp_path = self.updater.download_update(download_url, expected_sha256, progress)
+            self.download_queue.put(('done', (temp_path, self.updater.last_error)))
+        
+        self.status_label.config(text='Downloading update...')
+        self.download_thread = threading.Thread(target=worker, name='update-download', daemon=True)
+        self.download_thread.start()
+        self.root.after(100, lambda: self.poll_update_download(update_info))
+    
+    def poll_update_download(self, update_info: Dict):
+        """Show download progress and install once the worker is done"""
+        result = None
+        latest = None
+        
+        while True:
+            try:
+                kind, payload = self.download_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                latest = payload
+            else:
+                result = payload
+        
+        if latest is not None:
+            self.status_label.config(text=f'Downloading update... {format_progress(*latest)}')
+        
+        if result is None:
+            self.root.after(100, lambda: self.poll_update_download(update_info))
+            return
+        
+        temp_path, error = result
+        
         try:
-            # Show progress
-            self.status_label.config(text='Downloading update...')
-            self.root.update()
-            
-            # Download update
-            download_url = update_info.get('download_url', DOWNLOAD_URL)
-            temp_path = self.updater.download_update(download_url)
-            
             if not temp_path:
-                messagebox.showerror('Update Failed', 'Failed to download update')
+                self.logger.write(f'Update download failed: {error}')
+                messagebox.showerror('Update Failed', f'Failed to download update\n\n{error}')
                 self.status_label.config(text='Update failed')
                 return
             
             self.status_label.config(text='Installing update...')
-            self.root.update()
             
             # Apply update
             current_file = os.path.abspath(__file__)
@@ -876,83 +3677,7 @@ class ChromeLauncherUI:
         except Exception:
             pass
         
-        try:
-            self.root.update()
-        except Exception:
-            pass
-        
-        try:
-            update_info = self.updater.check_for_updates()
-            
-            if update_info:
-                self.show_update_dialog(update_info)
-            else:
-                messagebox.showinfo(
-                    'No Updates',
-                    f'You are running the latest version (v{VERSION})'
-                )
-            
-            try:
-                self.status_label.config(text='')
-            except Exception:
-                pass
-        except Exception as e:
-            messagebox.showerror('Update Check Failed', 'Could not check for updates.\nPlease check your internet connection.')
-            try:
-                self.status_label.config(text='')
-            except Exception:
-                pass
-            self.logger.write(f'Manual update check failed: {str(e)}')
-    
-    def launch_from_cli(self):
-        """Launch Chrome from command line"""
-        email = self.cli_args.email
-        incognito = self.cli_args.incognito
-        url = self.cli_args.url
-        
-        if email not in self.emails:
-            print(f"Error: Profile '{email}' not found")
-            sys.exit(1)
-        
-        chrome = ChromePathFinder.get_chrome_path_auto(
-            self.config.channel,
-            self.config.custom_chrome
-        )
-        
-        if not chrome:
-            print("Error: Chrome not found")
-            sys.exit(1)
-        
-        profile = ChromeProfileManager.get_profile_directory_by_email(email)
-        
-        if not profile:
-            print(f"Error: Profile directory not found for '{email}'")
-            sys.exit(1)
-        
-        # Build arguments
-        args = [chrome, f'--profile-directory={profile}']
-        
-        if incognito:
-            args.append('--incognito')
-        
-        if url:
-            args.append(url)
-        else:
-            choice = self.config.url_choice
-            if self.config.use_perurl == '1' and email in self.config.per_url:
-                choice = self.config.per_url[email]
-            args.append(self.default_urls.get(choice, self.default_urls['1']))
-        
-        # Launch without CMD window on Windows
-        if sys.platform == 'win32':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            subprocess.Popen(args, startupinfo=startupinfo)
-        else:
-            subprocess.Popen(args)
-        
-        print(f"Launched Chrome for {email}")
-        sys.exit(0)
+        self.request_update_check('manual')
     
     def apply_theme(self, theme: str):
         """Apply color theme"""
@@ -1013,6 +3738,7 @@ class ChromeLauncherUI:
         tools_menu.add_command(label='Clear Search History', command=self.clear_search_history)
         tools_menu.add_separator()
         tools_menu.add_command(label='Refresh Profiles', command=self.refresh_profiles)
+        tools_menu.add_command(label='Launch Latency...', command=self.show_launch_latency)
         tools_menu.add_separator()
         tools_menu.add_command(label='Check for Updates...', command=self.manual_check_update)
         
@@ -1079,15 +3805,15 @@ class ChromeLauncherUI:
         )
         channel_label.pack(side=tk.RIGHT, padx=(10, 0))
         
-        self.channel_var = tk.StringVar(value=self.config.channel)
-        channel_combo = ttk.Combobox(
+        self.channel_var = tk.StringVar(value=self.channel_label(self.config.channel))
+        self.channel_combo = ttk.Combobox(
             header_frame,
             textvariable=self.channel_var,
-            values=['Stable', 'Beta', 'Dev', 'Canary'],
+            values=[self.channel_label(c) for c in ChromeInstallRegistry.CHANNELS],
             state='readonly',
-            width=10
+            width=24
         )
-        channel_combo.pack(side=tk.RIGHT)
+        self.channel_combo.pack(side=tk.RIGHT)
         
         # Subtitle
         subtitle_label = tk.Label(
@@ -1126,6 +3852,41 @@ class ChromeLauncherUI:
         )
         incognito_cb.pack(side=tk.LEFT, padx=(20, 0))
         
+        # Open URLs in a new window instead of tabs in the current one
+        self.new_window_var = tk.BooleanVar(value=self.config.new_window == '1')
+        new_window_cb = tk.Checkbutton(
+            options_frame,
+            text='🗔 New Window',
+            variable=self.new_window_var,
+            fg=self.text,
+            bg=self.bg,
+            selectcolor=self.bg,
+            font=('Segoe UI', 9)
+        )
+        new_window_cb.pack(side=tk.LEFT, padx=(20, 0))
+        
+        # Batch launches leave already-open profiles alone
+        self.batch_skip_running_var = tk.BooleanVar(value=self.config.batch_skip_running == '1')
+        skip_running_cb = tk.Checkbutton(
+            options_frame,
+            text='⏭ Skip Running (batch)',
+            variable=self.batch_skip_running_var,
+            fg=self.text,
+            bg=self.bg,
+            selectcolor=self.bg,
+            font=('Segoe UI', 9)
+        )
+        skip_running_cb.pack(side=tk.LEFT, padx=(20, 0))
+        
+        self.running_label = tk.Label(
+            options_frame,
+            text='',
+            font=('Segoe UI', 9),
+            fg='#3CB371',
+            bg=self.bg
+        )
+        self.running_label.pack(side=tk.LEFT, padx=(20, 0))
+        
         # Quick Launch Buttons Frame
         quick_frame = tk.LabelFrame(
             self.root,
@@ -1259,16 +4020,16 @@ class ChromeLauncherUI:
         self.input_entry.bind('<Return>', lambda e: self.do_search())
         self.input_entry.bind('<Control-a>', self.select_all_input)
         
-        self.regex_var = tk.BooleanVar()
-        regex_cb = tk.Checkbutton(
+        self.search_mode_var = tk.StringVar(value=self.config.search_mode)
+        mode_combo = ttk.Combobox(
             input_frame,
-            text='Use Regex',
-            variable=self.regex_var,
-            fg=self.text,
-            bg=self.panel_bg,
-            selectcolor=self.panel_bg
+            textvariable=self.search_mode_var,
+            values=self.SEARCH_MODES,
+            state='readonly',
+            width=7
         )
-        regex_cb.pack(side=tk.LEFT, padx=(10, 0))
+        mode_combo.pack(side=tk.LEFT, padx=(10, 0))
+        mode_combo.bind('<<ComboboxSelected>>', lambda e: self.do_search())
         
         search_btn = tk.Button(
             input_frame,
@@ -1310,14 +4071,21 @@ class ChromeLauncherUI:
         fav_scroll = tk.Scrollbar(fav_frame)
         fav_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
+        fav_rows = tk.Variable(self.root)
         self.fav_listbox = tk.Listbox(
             fav_frame,
+            listvariable=fav_rows,
+            selectmode=tk.EXTENDED,
             font=('Segoe UI', 10),
             fg=self.input_fg,
             bg=self.input_bg,
             yscrollcommand=fav_scroll.set
         )
         self.fav_listbox.pack(fill=tk.BOTH, expand=True)
+        self.fav_view = VirtualListView(
+            self.fav_listbox, fav_rows,
+            key=lambda text: FAV_COUNT_RE.sub('', FAV_PREFIX_RE.sub('', text))
+        )
         fav_scroll.config(command=self.fav_listbox.yview)
         self.fav_listbox.bind('<Double-Button-1>', self.on_fav_double_click)
         self.fav_listbox.bind('<Button-3>', self.show_context_menu)
@@ -1338,14 +4106,18 @@ class ChromeLauncherUI:
         matches_scroll = tk.Scrollbar(matches_frame)
         matches_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
+        match_rows = tk.Variable(self.root)
         self.matches_listbox = tk.Listbox(
             matches_frame,
+            listvariable=match_rows,
+            selectmode=tk.EXTENDED,
             font=('Segoe UI', 10),
             fg=self.input_fg,
             bg=self.input_bg,
             yscrollcommand=matches_scroll.set
         )
         self.matches_listbox.pack(fill=tk.BOTH, expand=True)
+        self.match_view = VirtualListView(self.matches_listbox, match_rows)
         matches_scroll.config(command=self.matches_listbox.yview)
         self.matches_listbox.bind('<Return>', lambda e: self.open_selected())
         self.matches_listbox.bind('<Button-3>', self.show_context_menu)
@@ -1394,6 +4166,17 @@ class ChromeLauncherUI:
         )
         quick_btn.pack(side=tk.LEFT, padx=(10, 0))
         
+        self.stop_batch_btn = tk.Button(
+            action_frame,
+            text='Stop Batch',
+            font=('Segoe UI', 10),
+            fg=self.text,
+            bg=self.accent,
+            state=tk.DISABLED,
+            command=self.cancel_batch
+        )
+        self.stop_batch_btn.pack(side=tk.LEFT, padx=(10, 0))
+        
         exit_btn = tk.Button(
             action_frame,
             text='Exit (Esc)',
@@ -1428,6 +4211,7 @@ class ChromeLauncherUI:
         self.context_menu = Menu(self.root, tearoff=0)
         self.context_menu.add_command(label='Open', command=self.open_selected)
         self.context_menu.add_command(label='Open in Incognito', command=self.open_selected_incognito)
+        self.context_menu.add_command(label='Open All Selected', command=self.open_all_selected)
         self.context_menu.add_separator()
         self.context_menu.add_command(label='Toggle Favorite', command=self.toggle_favorite)
         self.context_menu.add_command(label='Show Info', command=self.show_profile_info)
@@ -1448,34 +4232,27 @@ class ChromeLauncherUI:
     
     def navigate_up(self, event):
         """Navigate up in lists"""
-        if self.matches_listbox.size() > 0:
-            current = self.matches_listbox.curselection()
+        if self.match_view.size() > 0:
+            current = self.match_view.curselection()
             if current:
-                idx = max(0, current[0] - 1)
-                self.matches_listbox.selection_clear(0, tk.END)
-                self.matches_listbox.selection_set(idx)
-                self.matches_listbox.see(idx)
+                self.match_view.select(max(0, current[0] - 1))
     
     def navigate_down(self, event):
         """Navigate down in lists"""
-        if self.matches_listbox.size() > 0:
-            current = self.matches_listbox.curselection()
+        if self.match_view.size() > 0:
+            current = self.match_view.curselection()
             if current:
-                idx = min(self.matches_listbox.size() - 1, current[0] + 1)
+                idx = min(self.match_view.size() - 1, current[0] + 1)
             else:
                 idx = 0
-            self.matches_listbox.selection_clear(0, tk.END)
-            self.matches_listbox.selection_set(idx)
-            self.matches_listbox.see(idx)
+            self.match_view.select(idx)
     
     def update_quick_launch_buttons(self):
         """Update quick launch buttons"""
         for widget in self.quick_buttons_frame.winfo_children():
             widget.destroy()
         
-        usage_list = [(email, count) for email, count in self.config.usage.items() if email in self.emails]
-        usage_list.sort(key=lambda x: x[1], reverse=True)
-        top_profiles = [email for email, _ in usage_list[:5]]
+        top_profiles = [email for email, _ in self.config.top_usage(5, self.emails)]
         
         if not top_profiles:
             tk.Label(
@@ -1501,31 +4278,22 @@ class ChromeLauncherUI:
     
     def populate_fav_list(self):
         """Populate favorites and recents list"""
-        self.fav_listbox.delete(0, tk.END)
+        usage = self.config.usage
         
         # Sort favorites by number
-        favorites = sort_emails_by_number(list(set(self.config.favorites)))
-        for email in favorites:
-            count = self.config.usage.get(email, 0)
-            self.fav_listbox.insert(tk.END, f"★ {email}  (x{count})")
+        favorites = self.emails.sort(set(self.config.favorites))
+        rows = [f"★ {email}  (x{usage.get(email, 0)})" for email in favorites]
         
         # Sort recents by number
-        recents = [r for r in self.config.recents if r not in favorites]
-        recents = sort_emails_by_number(recents)
-        for email in recents:
-            count = self.config.usage.get(email, 0)
-            self.fav_listbox.insert(tk.END, f"⏱ {email}  (x{count})")
+        favorite_set = set(favorites)
+        recents = self.emails.sort([r for r in self.config.recents if r not in favorite_set])
+        rows.extend(f"⏱ {email}  (x{usage.get(email, 0)})" for email in recents)
+        
+        self.fav_view.set_items(rows)
     
     def populate_matches(self, matches: List[str]):
-        """Populate matches list (already sorted)"""
-        self.matches_listbox.delete(0, tk.END)
-        # Sort matches by number
-        sorted_matches = sort_emails_by_number(matches)
-        for match in sorted_matches:
-            self.matches_listbox.insert(tk.END, match)
-        
-        if len(sorted_matches) > 0:
-            self.matches_listbox.selection_set(0)
+        """Populate matches list (already sorted, searches keep self.emails order)"""
+        self.match_view.set_items(matches, select_first=True)
     
     def normalize_digits(self, s: str) -> Tuple[str, str]:
         """Extract and normalize digits"""
@@ -1543,7 +4311,7 @@ class ChromeLauncherUI:
         """Perform search"""
         key = self.input_var.get().strip()
         self.status_label.config(text='')
-        self.matches_listbox.delete(0, tk.END)
+        self.match_view.clear()
         
         if not key:
             self.status_label.config(text='Enter a number or email first.')
@@ -1552,7 +4320,23 @@ class ChromeLauncherUI:
         self.config.add_search_history(key)
         self.input_entry['values'] = self.config.search_history
         
-        if self.regex_var.get():
+        mode = self.search_mode_var.get()
+        
+        if mode == 'Fuzzy':
+            try:
+                k = max(1, int(self.config.search_top_k))
+            except ValueError:
+                k = 50
+            matches = self.search_index.rank(key, self.config.usage, k)
+            if not matches:
+                self.status_label.config(text='No fuzzy match.')
+                return
+            
+            self.populate_matches(matches)
+            self.status_label.config(text=f'Top {len(matches)} fuzzy matches (best first).')
+            return
+        
+        if mode == 'Regex':
             try:
                 pattern = re.compile(key)
                 matches = [e for e in self.emails if pattern.search(e)]
@@ -1568,11 +4352,15 @@ class ChromeLauncherUI:
             return
         
         if '@' in key:
-            if key in self.emails:
+            if key in self.search_index:
                 self.populate_matches([key])
                 return
             
-            matches = [e for e in self.emails if key.lower() in e.lower()]
+            matches = self.search_cache.lookup(
+                'email', (key.lower(),),
+                lambda: self.search_index.find_substring(key),
+                lambda previous: self.search_index.refine_substring(previous, key)
+            )
             if not matches:
                 self.status_label.config(text='No emails contain that text.')
                 return
@@ -1585,8 +4373,11 @@ class ChromeLauncherUI:
             self.status_label.config(text='No digits found in input.')
             return
         
-        matches = [e for e in self.emails if digits in e or normalized in e]
-        matches = list(set(matches))
+        matches = self.search_cache.lookup(
+            'digits', (digits, normalized),
+            lambda: self.search_index.find_digits(digits, normalized),
+            lambda previous: self.search_index.refine_digits(previous, digits, normalized)
+        )
         
         if not matches:
             self.status_label.config(text=f'No emails contain: {digits} (or {normalized})')
@@ -1596,20 +4387,28 @@ class ChromeLauncherUI:
     
     def get_selected_email_from_fav(self) -> Optional[str]:
         """Get selected email from favorites list"""
-        selection = self.fav_listbox.curselection()
+        selection = self.fav_view.selected()
         if not selection:
             return None
         
-        text = self.fav_listbox.get(selection[0])
-        email = re.sub(r'^[^\s]+\s+', '', text)
-        email = re.sub(r'\s+\(x\d+\)\s*$', '', email)
+        text = selection[0]
+        email = FAV_PREFIX_RE.sub('', text)
+        email = FAV_COUNT_RE.sub('', email)
         return email
     
+    def get_selected_emails(self) -> List[str]:
+        """All selected emails (matches list first, then favorites)"""
+        selection = self.match_view.selected()
+        if selection:
+            return selection
+        
+        return [FAV_COUNT_RE.sub('', FAV_PREFIX_RE.sub('', text)) for text in self.fav_view.selected()]
+    
     def get_selected_email(self) -> Optional[str]:
         """Get currently selected email"""
-        selection = self.matches_listbox.curselection()
+        selection = self.match_view.selected()
         if selection:
-            return self.matches_listbox.get(selection[0])
+            return selection[0]
         
         return self.get_selected_email_from_fav()
     
@@ -1628,7 +4427,7 @@ class ChromeLauncherUI:
             self.config.favorites = list(set(self.config.favorites))
             self.status_label.config(text=f'Added to favorites: {email}')
         
-        self.config.save()
+        self.config.mark_dirty()
         self.populate_fav_list()
     
     def add_recent(self, email: str):
@@ -1636,94 +4435,620 @@ class ChromeLauncherUI:
         if not email:
             return
         
-        recents = [r for r in self.config.recents if r != email]
-        recents.insert(0, email)
-        self.config.recents = recents[:10]
+        self.config.add_recent(email)
     
     def bump_usage(self, email: str):
         """Increment usage count"""
-        if email not in self.config.usage:
-            self.config.usage[email] = 0
-        self.config.usage[email] += 1
+        self.config.bump_usage(email)
+    
+    def default_url_for(self, email: str) -> str:
+        """Default URL for a profile (per-URL choice if enabled)"""
+        return self.config.default_url_for(email, self.default_urls)
+    
+    def channel_label(self, channel: str) -> str:
+        """Combobox text for a channel: name plus detected version"""
+        version = self.channel_versions.get(channel)
+        if version is None:
+            return channel
+        return f'{channel} ({version or "not installed"})'
+    
+    def selected_channel(self) -> str:
+        """Channel name from the combobox text"""
+        return self.channel_var.get().split(' ', 1)[0]
+    
+    def probe_chrome_versions(self):
+        """Detect installed channel versions off the Tk thread"""
+        def worker():
+            installed = self.chrome_registry.installed()
+            versions = {}
+            for channel in ChromeInstallRegistry.CHANNELS:
+                if channel in installed:
+                    versions[channel] = self.chrome_registry.version(channel) or 'installed'
+                else:
+                    versions[channel] = ''
+            self.version_queue.put(versions)
+        
+        threading.Thread(target=worker, name='chrome-versions', daemon=True).start()
+        self.root.after(200, self.poll_chrome_versions)
+    
+    def poll_chrome_versions(self):
+        """Show detected versions in the channel combobox"""
+        try:
+            versions = self.version_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(200, self.poll_chrome_versions)
+            return
+        
+        channel = self.selected_channel()
+        self.channel_versions = versions
+        self.channel_combo['values'] = [self.channel_label(c) for c in ChromeInstallRegistry.CHANNELS]
+        self.channel_var.set(self.channel_label(channel))
+    
+    def spawn_with_recheck(self, args: List[str], channel: str, email: str = '') -> subprocess.Popen:
+        """Spawn Chrome (supervised); if the cached binary fails, re-probe installs once and retry"""
+        try:
+            return self.supervisor.spawn(args, email)
+        except OSError:
+            self.chrome_registry.refresh()
+            chrome = self.chrome_registry.resolve(channel, self.config.custom_chrome)
+            if not chrome:
+                raise
+            return self.supervisor.spawn([chrome] + args[1:], email)
+    
+    def handoff_dir(self, chrome: str) -> Optional[str]:
+        """User data dir of the browser a launch of chrome would join (None: custom binary)"""
+        return handoff_user_data_dir(self.chrome_registry.channel_of(chrome))
+    
+    def start_chrome(self, args: List[str], channel: str, email: str = '') -> str:
+        """Hand the command line to the channel's running browser, else spawn one; returns which"""
+        try:
+            if hand_off_to_chrome(self.handoff_dir(args[0]), args):
+                return 'handed off'
+            self.spawn_with_recheck(args, channel, email)
+            return 'spawned'
+        finally:
+            self.running_detector.invalidate()
+    
+    def open_via_devtools(self, port: int, urls: List[str], profile: str, user_data_dir: Optional[str]) -> bool:
+        """Open urls through profile's live DevTools endpoint; False means launch normally.
+        
+        /json/new opens tabs in whatever profile the endpoint's browser
+        picks, so it is only used when that browser runs in user_data_dir
+        and has no profile but this one open.
+        """
+        if not user_data_dir:
+            return False
+        
+        endpoint = DevToolsEndpoint(port)
+        if not endpoint.belongs_to(user_data_dir):
+            return False
+        
+        owner = RunningProfileDetector(user_data_dir, ttl=0).sole_profile()
+        if owner != profile:
+            self.logger.write(f'DevTools: port {port} is not {profile} alone ({owner or "unknown"}), launching instead')
+            return False
+        
+        for i, url in enumerate(urls):
+            if not endpoint.open_tab(url):
+                if i == 0:
+                    return False
+                # Part opened already, a relaunch would duplicate those tabs
+                self.logger.write(f'DevTools: could not open {url} on port {port}')
+        
+        self.logger.write(f'DevTools: opened {len(urls)} tab(s) on port {port}')
+        return True
+    
+    def current_running_emails(self) -> set:
+        """Emails of profiles open in a running browser"""
+        profile_dirs = self.running_detector.running_profiles()
+        if not profile_dirs:
+            return set()
+        
+        index = ProfileIndex.load(self.local_state_path)
+        if index is None:
+            return set()
+        return {index.email_for_dir[d] for d in profile_dirs if d in index.email_for_dir}
+    
+    def poll_running_profiles(self):
+        """Refresh the running marks in both lists; the scan runs on a worker thread"""
+        def worker():
+            try:
+                running = self.current_running_emails()
+            except Exception:
+                running = set()
+            self.running_queue.put(running)
+        
+        threading.Thread(target=worker, name='running-profiles', daemon=True).start()
+        self.root.after(100, self.apply_running_profiles)
+    
+    def apply_running_profiles(self):
+        """Show a finished running-profile scan, then schedule the next one"""
+        try:
+            running = self.running_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self.apply_running_profiles)
+            return
+        
+        if running != self.running_emails:
+            self.running_emails = running
+            self.match_view.set_marked(running)
+            self.fav_view.set_marked(running)
+            self.running_label.config(text=f'● {len(running)} running' if running else '')
+        
+        self.root.after(3000, self.poll_running_profiles)
+    
+    @staticmethod
+    def singleton_marker(user_data_dir: str) -> Tuple[str, Optional[Tuple[int, int]]]:
+        """Path of the file a starting browser creates in user_data_dir, and its identity now.
+        
+        Chrome (re)creates it once it accepts hand-offs from later launches;
+        a stale one left by a crash stays until then, so readiness means a
+        different identity (inode, mtime) than before the launch.
+        """
+        marker = 'lockfile' if sys.platform == 'win32' else 'SingletonSocket'
+        marker_path = os.path.join(user_data_dir, marker)
+        try:
+            st = os.lstat(marker_path)
+            return marker_path, (st.st_ino, st.st_mtime_ns)
+        except OSError:
+            return marker_path, None
+    
+    def wait_until_ready(self, timer: LaunchTimer, how: str, user_data_dir: Optional[str],
+                         before: Optional[Tuple[int, int]] = None, debug_port: int = 0):
+        """Have the ready watcher finish timer once a spawned browser can take input.
+        
+        Hand-offs and DevTools tabs join a browser that is already up, so
+        they are only counted, and a custom binary's user data dir is
+        unknown: neither has a ready time of its own.
+        """
+        if how != 'spawned':
+            self.latency.record_handoff(timer.email)
+            self.schedule_latency_save()
+            self.logger.write(f'Ready: email={timer.email}, {how}, not timed')
+        elif not user_data_dir:
+            self.logger.write(f'Ready: email={timer.email}, custom Chrome, not timed')
+        else:
+            endpoint = DevToolsEndpoint(debug_port, timeout=0.25) if debug_port else None
+            
+            def ready() -> bool:
+                marker = self.singleton_marker(user_data_dir)[1]
+                if marker is not None and marker != before:
+                    return True
+                # Its own endpoint up also counts (Chrome may ignore the port for some dirs)
+                return endpoint is not None and endpoint.belongs_to(user_data_dir)
+            
+            self.ready_watcher.watch(timer, ready)
+    
+    def poll_ready(self):
+        """Record finished launch timings and show the latest one"""
+        finished = []
+        while True:
+            try:
+                finished.append(self.ready_watcher.done.get_nowait())
+            except queue.Empty:
+                break
+        
+        for timer, ready in finished:
+            spans = timer.spans_ms()
+            total = timer.total_ms() if ready else None
+            self.latency.record(timer.email, spans, total)
+            phases = ', '.join(f'{phase}={ms:.0f}ms' for phase, ms in spans.items())
+            if ready:
+                self.logger.write(f'Ready: email={timer.email}, total={total:.0f}ms, {phases}')
+            else:
+                self.logger.write(f'Ready: email={timer.email}, not ready after {self.ready_watcher.timeout:.0f}s, {phases}')
+        
+        if finished:
+            timer, ready = finished[-1]
+            if ready:
+                self.status_label.config(text=f'{timer.email} ready in {timer.total_ms() / 1000:.2f}s.')
+            self.schedule_latency_save()
+        
+        self.root.after(100, self.poll_ready)
+    
+    def schedule_latency_save(self):
+        if self.latency_save_id is None:
+            self.latency_save_id = self.root.after(5000, self.save_latency)
+    
+    def save_latency(self):
+        """Debounced write of the latency histograms"""
+        self.latency_save_id = None
+        self.latency.save()
+    
+    def show_launch_latency(self):
+        """Show the profiles that take longest to become ready"""
+        slowest = self.latency.slowest(15)
+        if not slowest:
+            messagebox.showinfo('Launch Latency', 'No launches timed yet.')
+            return
+        
+        lines = []
+        for email, mean_ms, count in slowest:
+            entry = self.latency.profiles[email]
+            p90 = self.latency.percentile_bound(email, 0.9)
+            p90_text = f'≤{p90 / 1000:g}s' if p90 is not None else f'>{LatencyStats.BUCKETS_MS[-1] / 1000:g}s'
+            line = f'{email}: mean {mean_ms / 1000:.2f}s, p90 {p90_text}, max {entry["max_ms"] / 1000:.2f}s, n={count}'
+            if entry['timeouts']:
+                line += f', {entry["timeouts"]} never ready'
+            if entry.get('handoffs'):
+                line += f', {entry["handoffs"]} joined a running browser'
+            lines.append(line)
+        
+        messagebox.showinfo('Launch Latency', 'Slowest profiles (click to ready):\n\n' + '\n'.join(lines))
+    
+    def refresh_warm_pool(self):
+        """Re-rank and warm the pool every minute; the browser scan runs on a worker thread"""
+        try:
+            chrome = self.chrome_registry.resolve(self.selected_channel(), self.config.custom_chrome)
+        except Exception as e:
+            self.logger.write(f'Warm pool: {str(e)}')
+            chrome = None
+        
+        if not chrome or self.handoff_dir(chrome) != self.user_data_dir:
+            # The budget is measured on the browser of the default user data dir only
+            self.root.after(60000, self.refresh_warm_pool)
+            return
+        
+        def worker():
+            try:
+                browser_pid = self.running_detector.browser_pid()
+                scan = (
+                    browser_pid, process_tree_rss_mb(browser_pid), ProfileIndex.load(self.local_state_path),
+                    open_page_count(self.user_data_dir) if browser_pid is not None else None
+                )
+            except Exception as e:
+                scan = e
+            self.warm_scan_queue.put(scan)
+        
+        threading.Thread(target=worker, name='warm-pool-scan', daemon=True).start()
+        self.root.after(100, self.apply_warm_pool_scan, chrome)
+    
+    def apply_warm_pool_scan(self, chrome: str):
+        """Act on a finished warm pool scan, then schedule the next one"""
+        try:
+            scan = self.warm_scan_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self.apply_warm_pool_scan, chrome)
+            return
+        
+        try:
+            if isinstance(scan, Exception):
+                raise scan
+            self.update_warm_pool(chrome, *scan)
+        except Exception as e:
+            self.logger.write(f'Warm pool: {str(e)}')
+        
+        self.root.after(60000, self.refresh_warm_pool)
+    
+    def update_warm_pool(self, chrome: str, browser_pid: Optional[int], rss_mb: Optional[float],
+                         index: Optional[ProfileIndex], pages: Optional[int]):
+        """Apply the memory budget, then load ranked profiles that are not warm yet.
+        
+        The browser the pool started is only stopped while its DevTools
+        endpoint shows no open page. Windows can be opened in it from
+        anywhere (shortcuts, links from other apps), so once that can't
+        be confirmed, it is left alone for good.
+        """
+        pool = self.warm_pool
+        if browser_pid is None:
+            # Browser closed: nothing is loaded any more
+            pool.warm.clear()
+            pool.owned_pid = 0
+        elif rss_mb is None:
+            # It exited during the scan; try again next round
+            return
+        elif pool.owned_pid == browser_pid and pages != 0:
+            pool.owned_pid = 0
+        
+        evicted = pool.check_budget(rss_mb)
+        if evicted:
+            self.logger.write(f'Warm pool: over {pool.budget_mb} MB, dropped {evicted} (capacity {pool.capacity})')
+        
+        if not pool.capacity:
+            if pool.owned_pid and pool.owned_pid == browser_pid:
+                # Nobody has opened a window in the browser the pool started
+                import signal
+                try:
+                    os.kill(pool.owned_pid, signal.SIGTERM)
+                    self.logger.write(f'Warm pool: stopped idle browser {pool.owned_pid}')
+                except OSError:
+                    pass
+                pool.owned_pid = 0
+            return
+        
+        if pool.over_budget(rss_mb) or (self.warm_queue is not None and self.warm_queue.running):
+            return
+        
+        picks = pool.rank(dict(self.config.top_usage(50)), self.config.recents, self.emails)
+        # Re-send the stale ones too, Chrome may unload profiles without windows
+        now = time.time()
+        to_warm = [email for email in picks if now - pool.warm.get(email, 0) > 300]
+        if not to_warm or index is None:
+            return
+        
+        channel = self.selected_channel()
+        jobs = []
+        for email in to_warm:
+            profile = index.profile_dir_for(email)
+            if profile:
+                # With DEVTOOLS_TABS a browser the pool starts gets an endpoint, so it can be seen to be idle
+                debug_port = self.config.devtools_port_for(channel, profile) if self.config.devtools_tabs == '1' else 0
+                args = build_chrome_args(chrome, profile, [], debug_port=debug_port) + ['--no-startup-window']
+                jobs.append(LaunchJob(email, [args]))
+        
+        user_data_dir = self.user_data_dir
+        
+        def launch(job):
+            for args in job.commands:
+                if hand_off_to_chrome(user_data_dir, args):
+                    continue
+                before = self.singleton_marker(user_data_dir)[1]
+                process = self.spawn_with_recheck(args, channel, job.email)
+                if browser_pid is None and not pool.owned_pid:
+                    pool.owned_pid = process.pid
+                # Let the new browser come up so the next profiles are hand-offs
+                deadline = time.monotonic() + 10
+                while (self.singleton_marker(user_data_dir)[1] in (None, before)
+                       and process.poll() is None and time.monotonic() < deadline):
+                    time.sleep(0.05)
+        
+        self.warm_queue = LaunchQueue(1, 0.5, launch)
+        self.warm_queue.start(jobs)
+        self.logger.write(f'Warm pool: loading {", ".join(job.email for job in jobs)}')
+        self.root.after(200, self.poll_warm_queue)
+    
+    def poll_warm_queue(self):
+        """Mark profiles warm as their windowless launches finish"""
+        while True:
+            try:
+                job = self.warm_queue.events.get_nowait()
+            except queue.Empty:
+                break
+            
+            if job is None:
+                self.running_detector.invalidate()
+                return
+            if job.status == 'ok':
+                self.warm_pool.mark_warm(job.email)
+            else:
+                self.logger.write(f'Warm pool: {job.email} {job.status} {job.error}'.rstrip())
+        
+        self.root.after(200, self.poll_warm_queue)
+    
+    def poll_supervisor(self):
+        """Show launches whose Chrome process exited with an error"""
+        failed = []
+        while True:
+            try:
+                failed.append(self.supervisor.failures.get_nowait())
+            except queue.Empty:
+                break
+        
+        if failed:
+            email, code, reason = failed[-1]
+            text = f'Chrome for {email} exited with code {code}'
+            if reason:
+                text += f': {reason[:120]}'
+            if len(failed) > 1:
+                text += f' (+{len(failed) - 1} more failed, see log)'
+            self.status_label.config(text=text)
+        
+        self.root.after(500, self.poll_supervisor)
+    
+    def launch_batch(self, emails: List[str], urls: List[str] = None, incognito: bool = None):
+        """Open many profiles through the launch queue"""
+        if self.batch is not None and self.batch.running:
+            self.status_label.config(text='A batch launch is already running.')
+            return
+        
+        if incognito is None:
+            incognito = self.incognito_var.get()
+        
+        channel = self.selected_channel()
+        chrome = self.chrome_registry.resolve(channel, self.config.custom_chrome)
+        
+        if not chrome:
+            messagebox.showerror(
+                'Chrome missing',
+                'Chrome not found (any channel).\n\n'
+                'Please install Google Chrome or use "Custom Chrome..." to select the executable.'
+            )
+            return
+        
+        # One Local State parse for the whole batch
+        try:
+            index = ProfileIndex.load()
+        except Exception:
+            index = None
+        
+        jobs = []
+        for email in emails:
+            job = LaunchJob(email, [], incognito)
+            profile = index.profile_dir_for(email) if index else None
+            if not profile:
+                job.fail('profile not found in Local State')
+            else:
+                job.commands = [build_chrome_args(
+                    chrome, profile, urls or [self.default_url_for(email)], incognito,
+                    self.new_window_var.get()
+                )]
+            jobs.append(job)
+        
+        try:
+            concurrency = int(self.config.batch_concurrency)
+            stagger = int(self.config.batch_stagger_ms) / 1000
+        except ValueError:
+            concurrency, stagger = 4, 0.25
+        
+        if self.batch_skip_running_var.get():
+            running = self.current_running_emails()
+            for job in jobs:
+                if job.status == 'pending' and job.email in running:
+                    job.skip('already running')
+        
+        def launch(job):
+            for args in job.commands:
+                self.start_chrome(args, channel, job.email)
+        
+        self.batch = LaunchQueue(concurrency, stagger, launch)
+        self.batch.start(jobs)
+        self.logger.write(f'Batch start: {len(jobs)} profiles, concurrency={concurrency}, stagger={stagger}s')
+        self.stop_batch_btn.config(state=tk.NORMAL)
+        self.status_label.config(text=f'Batch: launching {len(jobs)} profiles...')
+        self.root.after(100, self.poll_batch)
+    
+    def poll_batch(self):
+        """Apply finished batch jobs on the Tk thread and report progress"""
+        batch = self.batch
+        finished = False
+        
+        while True:
+            try:
+                job = batch.events.get_nowait()
+            except queue.Empty:
+                break
+            
+            if job is None:
+                finished = True
+                break
+            
+            if job.status == 'ok':
+                self.config.last_email = job.email
+                self.add_recent(job.email)
+                self.bump_usage(job.email)
+                self.logger.write(f'Batch open: email={job.email}, incognito={job.incognito}, {job.elapsed * 1000:.0f} ms')
+            elif job.status == 'failed':
+                self.logger.write(f'Batch failed: email={job.email}: {job.error}')
+        
+        ok = batch.count('ok')
+        failed = batch.count('failed')
+        cancelled = batch.count('cancelled')
+        skipped = batch.count('skipped')
+        summary = (
+            f'{ok}/{len(batch.jobs)} launched, {failed} failed'
+            + (f', {skipped} already running' if skipped else '')
+            + (f', {cancelled} cancelled' if cancelled else '')
+            + f' ({batch.throughput():.1f} profiles/s)'
+        )
+        
+        if not finished:
+            self.status_label.config(text=f'Batch: {summary}')
+            self.root.after(100, self.poll_batch)
+            return
+        
+        # One config write for the whole batch
+        self.config.save()
+        self.logger.write(f'Batch done: {summary}')
+        self.status_label.config(text=f'Batch done: {summary}')
+        self.stop_batch_btn.config(state=tk.DISABLED)
+        self.populate_fav_list()
+        self.update_quick_launch_buttons()
+    
+    def cancel_batch(self):
+        """Stop the running batch launch"""
+        if self.batch is not None and self.batch.running:
+            self.batch.cancel()
+            self.status_label.config(text='Batch: cancelling...')
     
-    def open_for(self, email: str, extra_urls: List[str] = None, incognito: bool = None):
-        """Open Chrome for specific email"""
+    def open_for(self, email: str, extra_urls: List[str] = None, incognito: bool = None,
+                 interactive: bool = True) -> str:
+        """Open Chrome for specific email; returns '' on success, else the error.
+        
+        interactive=False (forwarded requests) reports errors only through
+        the return value instead of dialogs.
+        """
         if extra_urls is None:
             extra_urls = []
         
         if incognito is None:
             incognito = self.incognito_var.get()
         
+        def fail(show, title: str, message: str, short: str) -> str:
+            if interactive:
+                show(title, message)
+            return short
+        
         try:
             if not email:
-                return
+                return 'No email given'
             
-            chrome = ChromePathFinder.get_chrome_path_auto(
-                self.channel_var.get(),
-                self.config.custom_chrome
-            )
+            timer = LaunchTimer(email)
+            channel = self.selected_channel()
+            chrome = self.chrome_registry.resolve(channel, self.config.custom_chrome)
+            timer.mark('resolve')
             
             if not chrome:
-                messagebox.showerror(
-                    'Chrome missing',
+                return fail(
+                    messagebox.showerror, 'Chrome missing',
                     'Chrome not found (any channel).\n\n'
-                    'Please install Google Chrome or use "Custom Chrome..." to select the executable.'
+                    'Please install Google Chrome or use "Custom Chrome..." to select the executable.',
+                    'Chrome not found'
                 )
-                return
             
             profile = ChromeProfileManager.get_profile_directory_by_email(email)
+            timer.mark('profile')
             
             if not profile:
-                messagebox.showwarning(
-                    'Profile missing',
+                return fail(
+                    messagebox.showwarning, 'Profile missing',
                     f'Profile not found in Chrome Local State.\n\n'
-                    f'Please log in to "{email}" in Chrome on this machine first.'
+                    f'Please log in to "{email}" in Chrome on this machine first.',
+                    f"Profile '{email}' not found"
                 )
-                return
             
             # Get URLs - if extra_urls is provided, use only those
             if not extra_urls:
-                # Use default URL
-                choice = self.config.url_choice
-                if self.config.use_perurl == '1' and email in self.config.per_url:
-                    choice = self.config.per_url[email]
-                extra_urls = [self.default_urls.get(choice, self.default_urls['1'])]
-            
-            # Launch Chrome for each URL
-            for url in extra_urls:
-                args = [chrome, f'--profile-directory={profile}']
-                
-                if incognito:
-                    args.append('--incognito')
-                
-                args.append(url)
-                
-                self.logger.write(
-                    f'Open: email={email}, profile={profile}, '
-                    f'channel={self.channel_var.get()}, incognito={incognito}, url={url}'
-                )
-                
-                # Hide CMD window on Windows
-                if sys.platform == 'win32':
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    subprocess.Popen(args, startupinfo=startupinfo)
-                else:
-                    subprocess.Popen(args)
+                extra_urls = [self.default_url_for(email)]
+            
+            new_window = self.new_window_var.get()
+            self.logger.write(
+                f'Open: email={email}, profile={profile}, '
+                f'channel={channel}, incognito={incognito}, '
+                f'new_window={new_window}, urls={" ".join(extra_urls)}'
+            )
+            
+            # Opt-in: tabs for a profile whose DevTools endpoint is up are one
+            # local HTTP request each (not for incognito/new window, which need a launch)
+            debug_port = 0
+            how = ''
+            if self.config.devtools_tabs == '1' and not incognito and not new_window:
+                debug_port = self.config.devtools_port_for(channel, profile)
+                if self.open_via_devtools(debug_port, extra_urls, profile, self.handoff_dir(chrome)):
+                    how = 'devtools'
             
+            ready_dir = self.handoff_dir(chrome)
+            before = None
+            if not how:
+                if ready_dir:
+                    before = self.singleton_marker(ready_dir)[1]
+                # One Chrome invocation for all URLs
+                args = build_chrome_args(chrome, profile, extra_urls, incognito, new_window, debug_port)
+                how = self.start_chrome(args, channel, email)
+            timer.mark('spawn')
+            self.wait_until_ready(timer, how, ready_dir, before, debug_port)
+            
+            warm = email in self.warm_pool.warm
             self.config.last_email = email
             self.add_recent(email)
             self.bump_usage(email)
-            self.config.save()
+            self.warm_pool.record_open(email)
+            self.config.mark_dirty()
             
             mode = ' (Incognito)' if incognito else ''
+            if warm:
+                mode += ' (warm)'
+            if how == 'handed off':
+                mode += ' in the running browser'
+            elif how == 'devtools':
+                mode += ' via DevTools'
             self.status_label.config(text=f'Opened {len(extra_urls)} tab(s) for {email}{mode}.')
             self.populate_fav_list()
             self.update_quick_launch_buttons()
+            return ''
             
         except Exception as e:
-            messagebox.showerror('Error', f'Error: {str(e)}')
             self.logger.write(f'Error Opening: {str(e)}')
+            return fail(messagebox.showerror, 'Error', f'Error: {str(e)}', str(e))
     
     def open_selected(self):
         """Open Chrome for selected email"""
@@ -1733,8 +5058,22 @@ class ChromeLauncherUI:
             messagebox.showinfo('No selection', 'Select an email first.')
             return
         
+        if len(self.get_selected_emails()) > 1:
+            self.open_all_selected()
+            return
+        
         self.open_for(email)
     
+    def open_all_selected(self):
+        """Open every selected profile (batch)"""
+        emails = self.get_selected_emails()
+        
+        if not emails:
+            messagebox.showinfo('No selection', 'Select an email first.')
+            return
+        
+        self.launch_batch(emails)
+    
     def open_selected_incognito(self):
         """Open in incognito"""
         email = self.get_selected_email()
@@ -1776,17 +5115,174 @@ class ChromeLauncherUI:
             messagebox.showinfo('No URLs selected', 'Please check at least one URL to open.')
             return
         
+        emails = self.get_selected_emails()
+        if len(emails) > 1:
+            self.launch_batch(emails, urls=urls)
+            return
+        
         self.open_for(email, extra_urls=urls)
     
     def refresh_profiles(self):
         """Refresh profiles"""
-        self.emails = ChromeProfileManager.get_emails_from_local_state()
+        self.emails.update(ChromeProfileManager.get_emails_from_local_state())
+        self.search_index = EmailSearchIndex(self.emails)
+        self.search_cache.bump_generation()
         self.status_label.config(text=f'Profiles refreshed: {len(self.emails)} found (sorted by number).')
         self.populate_fav_list()
         
         if self.input_var.get():
             self.do_search()
     
+    def start_watching(self):
+        """Watch Local State and the cfg, polling from the Tk loop"""
+        self.watcher = FileWatcher([self.local_state_path, self.config_path])
+        self.profile_queue: queue.Queue = queue.Queue()
+        self.profile_reload_busy = False
+        self.profile_reload_again = False
+        self.watch_poll_id = self.root.after(self.watch_interval_ms(), self.poll_watcher)
+    
+    def watch_interval_ms(self) -> int:
+        """Draining inotify is nearly free, stat polling less so"""
+        return 500 if self.watcher.uses_inotify else 2000
+    
+    def poll_watcher(self):
+        """React to files changed since the last poll"""
+        self.watch_poll_id = None
+        try:
+            changed = self.watcher.poll()
+            if self.config_path in changed and self.config.merge_external():
+                self.on_config_merged()
+            if self.local_state_path in changed:
+                self.reload_profiles_async()
+        except Exception as e:
+            self.logger.write(f'Watcher error: {e}')
+        
+        self.watch_poll_id = self.root.after(self.watch_interval_ms(), self.poll_watcher)
+    
+    def on_config_merged(self):
+        """Show settings another launcher changed"""
+        self.populate_fav_list()
+        self.update_quick_launch_buttons()
+        self.input_entry['values'] = self.config.search_history
+        self.status_label.config(text='Settings updated by another launcher.')
+    
+    def reload_profiles_async(self):
+        """Re-read Local State and rebuild the search index off the Tk thread"""
+        if self.profile_reload_busy:
+            self.profile_reload_again = True
+            return
+        self.profile_reload_busy = True
+        current = self.emails.members
+        
+        def worker():
+            try:
+                index = ProfileIndex.load(self.local_state_path)
+                emails = list(index.emails) if index is not None else []
+                # Chrome rewrites Local State often; most writes leave the emails alone
+                if set(emails) == current:
+                    self.profile_queue.put((current, None))
+                    return
+                self.profile_queue.put((emails, EmailSearchIndex(emails)))
+            except Exception as e:
+                self.profile_queue.put(e)
+        
+        threading.Thread(target=worker, name='profile-reload', daemon=True).start()
+        self.root.after(100, self.poll_profile_reload)
+    
+    def poll_profile_reload(self):
+        """Apply a finished background profile reload"""
+        try:
+            result = self.profile_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self.poll_profile_reload)
+            return
+        
+        self.profile_reload_busy = False
+        if isinstance(result, Exception):
+            self.logger.write(f'Profile reload failed: {result}')
+        else:
+            emails, search_index = result
+            if search_index is None:
+                if emails is not self.emails.members:
+                    # Profiles were refreshed since the worker compared, check again
+                    self.profile_reload_again = True
+                added, removed = [], []
+            else:
+                added, removed = self.emails.update(emails)
+            if added or removed:
+                # Same order as self.emails: both sort by email_sort_key
+                self.search_index = search_index
+                self.search_cache.bump_generation()
+                self.populate_fav_list()
+                if self.input_var.get():
+                    self.do_search()
+                self.status_label.config(
+                    text=f'Profiles changed: +{len(added)} / -{len(removed)} ({len(self.emails)} total).'
+                )
+        
+        if self.profile_reload_again:
+            self.profile_reload_again = False
+            self.reload_profiles_async()
+    
+    def start_instance_server(self):
+        """Become the single instance, if enabled and no other GUI is running"""
+        self.instance_server = None
+        if self.config.single_instance != '1':
+            return
+        
+        path = instance_socket_path()
+        if path is None:
+            return
+        
+        server = InstanceServer(path)
+        if server.start():
+            self.instance_server = server
+            self.root.after(100, self.poll_instance_requests)
+    
+    def poll_instance_requests(self):
+        """Serve requests forwarded by other runs"""
+        while True:
+            try:
+                request, conn = self.instance_server.requests.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                self.handle_instance_request(request, conn)
+            except Exception as e:
+                InstanceServer.respond(conn, False, f'Error: {e}')
+                self.logger.write(f'Forwarded request failed: {e}')
+        
+        if self.instance_server is not None:
+            self.root.after(100, self.poll_instance_requests)
+    
+    def handle_instance_request(self, request: Dict, conn):
+        """Act on one forwarded request and answer with the outcome"""
+        action = request.get('action')
+        
+        if action == 'ping':
+            InstanceServer.respond(conn, True, 'pong')
+        elif action == 'show':
+            InstanceServer.respond(conn, True, 'Launcher window raised')
+            self.root.deiconify()
+            self.root.lift()
+            self.root.focus_force()
+        elif action == 'launch':
+            email = request.get('email', '')
+            if email not in self.emails:
+                InstanceServer.respond(conn, False, f"Error: Profile '{email}' not found")
+                return
+            
+            url = request.get('url') or ''
+            self.logger.write(f'Forwarded launch: email={email}')
+            error = self.open_for(email, [url] if url else None, bool(request.get('incognito')), interactive=False)
+            if error:
+                InstanceServer.respond(conn, False, f'Error: {error}')
+            else:
+                InstanceServer.respond(conn, True, f'Launched Chrome for {email}')
+        else:
+            InstanceServer.respond(conn, False, f'Error: unknown action {action!r}')
+    
     def pick_custom_chrome(self):
         """Pick custom Chrome"""
         if sys.platform == 'win32':
@@ -1801,7 +5297,7 @@ class ChromeLauncherUI:
         
         if filename:
             self.config.custom_chrome = filename
-            self.config.save()
+            self.config.mark_dirty()
             self.status_label.config(text='Custom Chrome set.')
     
     def on_theme_changed(self, event):
@@ -1846,15 +5342,15 @@ class ChromeLauncherUI:
         self.root.wait_window(dialog.dialog)
         
         if dialog.result is not None:
-            self.config.custom_urls = dialog.result
-            self.config.save()
+            self.config.set_custom_urls(dialog.result)
+            self.config.mark_dirty()
             self.status_label.config(text=f'Custom URLs updated. Total: {len(self.config.custom_urls)}')
     
     def clear_search_history(self):
         """Clear search history"""
         if messagebox.askyesno('Confirm', 'Clear all search history?'):
-            self.config.search_history = []
-            self.config.save()
+            self.config.clear_search_history()
+            self.config.mark_dirty()
             self.input_entry['values'] = []
             self.status_label.config(text='Search history cleared.')
     
@@ -1869,8 +5365,7 @@ class ChromeLauncherUI:
             )
             
             if filename:
-                import shutil
-                shutil.copy(self.config_path, filename)
+                self.config.export_file(filename)
                 self.status_label.config(text='Config exported.')
                 messagebox.showinfo('Success', f'Configuration exported to:\n{filename}')
         except Exception as e:
@@ -1885,12 +5380,11 @@ class ChromeLauncherUI:
             )
             
             if filename:
-                import shutil
-                shutil.copy(filename, self.config_path)
-                self.config.load()
+                self.config.import_file(filename)
                 
-                self.channel_var.set(self.config.channel)
+                self.channel_var.set(self.channel_label(self.config.channel))
                 self.theme_var.set(self.config.theme)
+                self.search_mode_var.set(self.config.search_mode)
                 self.input_entry['values'] = self.config.search_history
                 
                 self.populate_fav_list()
@@ -1949,12 +5443,34 @@ Features:
             self.config.window_y = str(self.root.winfo_y())
             self.config.window_w = str(self.root.winfo_width())
             self.config.window_h = str(self.root.winfo_height())
-            self.config.channel = self.channel_var.get()
+            self.config.channel = self.selected_channel()
             self.config.theme = self.theme_var.get()
+            self.config.new_window = '1' if self.new_window_var.get() else '0'
+            self.config.search_mode = self.search_mode_var.get()
+            self.config.batch_skip_running = '1' if self.batch_skip_running_var.get() else '0'
+            # Don't overwrite what another launcher wrote since our last poll
+            self.config.merge_external()
             self.config.save()
+            self.logger.write(
+                f'Config writes this session: {self.config.write_count} '
+                f'({self.config.bytes_written} bytes, {self.config.skipped_writes} unchanged skipped)'
+            )
         except Exception:
             pass
         
+        if self.watch_poll_id is not None:
+            self.root.after_cancel(self.watch_poll_id)
+        self.watcher.close()
+        if self.instance_server is not None:
+            self.instance_server.close()
+        if self.warm_queue is not None:
+            self.warm_queue.cancel()
+        self.supervisor.close()
+        self.ready_watcher.close()
+        self.latency.save()
+        self.warm_pool.save()
+        
+        self.logger.close()
         self.root.destroy()
     
     def run(self):
@@ -1971,6 +5487,177 @@ Features:
         self.root.mainloop()
 
 
+def launch_from_cli(args) -> int:
+    """Launch Chrome from command line, without tkinter or the UI.
+    
+    Reads the cfg and parses Local State once; returns the exit code.
+    """
+    email = args.email
+    
+    config = ChromeLauncherConfig(CONFIG_FILE)
+    config.load()
+    
+    try:
+        index = ProfileIndex.load()
+    except Exception:
+        index = None
+    profile = index.profile_dir_for(email) if index is not None else None
+    
+    if not profile:
+        print(f"Error: Profile '{email}' not found")
+        return 1
+    
+    # One-shot process: the direct lookup stops at the first hit, no registry needed
+    chrome = ChromePathFinder.get_chrome_path_auto(config.channel, config.custom_chrome)
+    
+    if not chrome:
+        print("Error: Chrome not found")
+        return 1
+    
+    url = args.url or config.default_url_for(email)
+    
+    # A running browser takes the command line over its singleton socket,
+    # otherwise launch without CMD window on Windows
+    command = build_chrome_args(chrome, profile, [url], args.incognito)
+    if not hand_off_to_chrome(handoff_user_data_dir(ChromePathFinder.channel_for_path(chrome)), command):
+        spawn_chrome(command)
+    
+    print(f"Launched Chrome for {email}")
+    return 0
+
+
+def parse_number_ranges(spec: str) -> List[Tuple[int, int]]:
+    """'001-250,300' -> [(1, 250), (300, 300)]"""
+    ranges = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        low, sep, high = part.partition('-')
+        start = int(low)
+        end = int(high) if sep else start
+        ranges.append((min(start, end), max(start, end)))
+    
+    if not ranges:
+        raise ValueError(f'empty range: {spec!r}')
+    return ranges
+
+
+def read_email_list(path: str) -> List[str]:
+    """Emails from a file ('-' = stdin), one per line; blank lines and # comments skipped"""
+    if path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+
+
+def cli_batch_emails(args, index: 'ProfileIndex') -> List[str]:
+    """Emails selected by --email, --range and --emails-file, in order, without duplicates"""
+    emails = []
+    if args.email:
+        emails.append(args.email)
+    
+    if args.range:
+        ranges = parse_number_ranges(args.range)
+        # Same numeric key the lists sort by
+        emails.extend(
+            email for email in index.emails
+            if any(low <= extract_number_from_email(email) <= high for low, high in ranges)
+        )
+    
+    if args.emails_file:
+        emails.extend(read_email_list(args.emails_file))
+    
+    return list(dict.fromkeys(emails))
+
+
+def launch_batch_from_cli(args) -> int:
+    """Launch many profiles from the command line and print a JSON summary.
+    
+    Local State is parsed once for the whole batch; launches go through
+    LaunchQueue with the configured (or given) concurrency and stagger.
+    """
+    config = ChromeLauncherConfig(CONFIG_FILE)
+    config.load()
+    
+    try:
+        index = ProfileIndex.load()
+    except Exception:
+        index = None
+    
+    if index is None:
+        print('Error: Chrome Local State not found', file=sys.stderr)
+        return 1
+    
+    try:
+        emails = cli_batch_emails(args, index)
+    except (OSError, ValueError) as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 2
+    
+    chrome = ChromePathFinder.get_chrome_path_auto(config.channel, config.custom_chrome)
+    if not chrome:
+        print('Error: Chrome not found', file=sys.stderr)
+        return 1
+    
+    jobs = []
+    profiles = {}
+    for email in emails:
+        job = LaunchJob(email, [], args.incognito)
+        profile = index.profile_dir_for(email)
+        if not profile:
+            job.fail('profile not found in Local State')
+        else:
+            profiles[email] = profile
+            url = args.url or config.default_url_for(email)
+            job.commands = [build_chrome_args(chrome, profile, [url], args.incognito)]
+        jobs.append(job)
+    
+    try:
+        concurrency = args.concurrency or int(config.batch_concurrency)
+        stagger_ms = args.stagger if args.stagger is not None else int(config.batch_stagger_ms)
+    except ValueError:
+        concurrency, stagger_ms = 4, 250
+    
+    user_data_dir = handoff_user_data_dir(ChromePathFinder.channel_for_path(chrome))
+    
+    def launch(job):
+        for command in job.commands:
+            if not hand_off_to_chrome(user_data_dir, command):
+                spawn_chrome(command)
+    
+    batch = LaunchQueue(concurrency, stagger_ms / 1000, launch)
+    batch.start(jobs)
+    try:
+        batch.wait()
+    except KeyboardInterrupt:
+        batch.cancel()
+        batch.wait()
+    
+    summary = {
+        'requested': len(jobs),
+        'ok': batch.count('ok'),
+        'failed': batch.count('failed'),
+        'cancelled': batch.count('cancelled'),
+        'elapsed_ms': round((batch.finished_at - batch.started_at) * 1000, 1),
+        'launches': [
+            {
+                'email': job.email,
+                'profile': profiles.get(job.email, ''),
+                'status': job.status,
+                'error': job.error,
+                'elapsed_ms': round(job.elapsed * 1000, 1)
+            }
+            for job in jobs
+        ]
+    }
+    print(json.dumps(summary, indent=2))
+    return 0 if summary['ok'] == len(jobs) else 1
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Chrome Profile Launcher ULTRA')
@@ -1978,13 +5665,39 @@ def main():
     parser.add_argument('--url', '-u', help='URL to open')
     parser.add_argument('--incognito', '-i', action='store_true', help='Open in incognito mode')
     
+    batch_group = parser.add_argument_group('batch launch (prints a JSON summary)')
+    batch_group.add_argument('--range', '-r', help='Profile numbers to launch, e.g. 001-250 or 1-10,42')
+    batch_group.add_argument('--emails-file', '-f', help="File with one email per line ('-' reads stdin)")
+    batch_group.add_argument('--concurrency', type=int, help='Launches in flight at once (default BATCH_CONCURRENCY)')
+    batch_group.add_argument('--stagger', type=int, help='Milliseconds between launches (default BATCH_STAGGER_MS)')
+    
     args = parser.parse_args()
     
+    if args.range or args.emails_file:
+        sys.exit(launch_batch_from_cli(args))
+    
+    if args.email:
+        # A running GUI launches from its warm caches and owns the config writes
+        reply = forward_to_instance({
+            'action': 'launch',
+            'email': args.email,
+            'url': args.url or '',
+            'incognito': args.incognito
+        }, timeout=30.0)
+        if reply is not None:
+            print(reply.get('message', ''))
+            sys.exit(0 if reply.get('ok') else 1)
+        
+        sys.exit(launch_from_cli(args))
+    
+    if forward_to_instance({'action': 'show'}) is not None:
+        sys.exit(0)
+    
     try:
-        app = ChromeLauncherUI(cli_args=args)
-        if not args.email:
-            app.run()
+        app = ChromeLauncherUI()
+        app.run()
     except Exception as e:
+        _load_tk()
         messagebox.showerror('Fatal', f'UI error: {str(e)}')
         print('Press Enter to exit...')
         input()
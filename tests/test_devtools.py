@@ -0,0 +1,205 @@
+"""DevTools tab opening against a local http.server stand-in"""
+
+import http.server
+import importlib.util
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.parse
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'chrome_launcher_ui_v2.2.py')
+
+spec = importlib.util.spec_from_file_location('chrome_launcher_ui', LAUNCHER)
+launcher = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(launcher)
+
+TARGET = '/devtools/browser/3f1c2a'
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    """Answers /json/version and PUT /json/new like a Chrome browser process"""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.opened = []
+        self.targets = [{'id': 'bg', 'type': 'background_page'}]
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/json/version':
+            self.reply(200, {
+                'Browser': 'Chrome/126.0.0.0',
+                'webSocketDebuggerUrl': f'ws://127.0.0.1:{self.server.port}{TARGET}',
+            })
+        elif self.path == '/json/list':
+            self.reply(200, self.server.targets)
+        else:
+            self.reply(404, {})
+
+    def do_PUT(self):
+        path, _, query = self.path.partition('?')
+        if path != '/json/new':
+            self.reply(404, {})
+            return
+        self.server.opened.append(urllib.parse.unquote(query))
+        self.reply(200, {'id': str(len(self.server.opened)), 'type': 'page'})
+
+
+class DevToolsEndpointTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StandInServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.user_data = tempfile.TemporaryDirectory()
+        self.addCleanup(self.user_data.cleanup)
+        self.endpoint = launcher.DevToolsEndpoint(self.server.port)
+
+    def write_active_port(self, port, target=TARGET):
+        with open(os.path.join(self.user_data.name, 'DevToolsActivePort'), 'w') as f:
+            f.write(f'{port}\n{target}')
+
+    def test_open_tab_sends_encoded_url(self):
+        url = 'https://example.com/a?b=1&c=2#frag'
+        self.assertTrue(self.endpoint.open_tab(url))
+        self.assertEqual(self.server.opened, [url])
+
+    def test_belongs_to_matching_browser(self):
+        self.write_active_port(self.server.port)
+        self.assertTrue(self.endpoint.belongs_to(self.user_data.name))
+
+    def test_not_ours_without_active_port_file(self):
+        self.assertIsNotNone(self.endpoint.version())
+        self.assertFalse(self.endpoint.belongs_to(self.user_data.name))
+
+    def test_not_ours_when_port_file_names_another_port(self):
+        self.write_active_port(self.server.port + 1)
+        self.assertFalse(self.endpoint.belongs_to(self.user_data.name))
+
+    def test_not_ours_when_another_browser_answers(self):
+        # Our browser wrote the port, but a different browser target answers on it
+        self.write_active_port(self.server.port, '/devtools/browser/other')
+        self.assertFalse(self.endpoint.belongs_to(self.user_data.name))
+
+    def test_page_count_ignores_background_targets(self):
+        self.assertEqual(self.endpoint.page_count(), 0)
+        self.server.targets.append({'id': 'tab', 'type': 'page'})
+        self.assertEqual(self.endpoint.page_count(), 1)
+
+    def test_open_page_count_needs_a_verified_endpoint(self):
+        self.assertIsNone(launcher.open_page_count(self.user_data.name))
+        self.write_active_port(self.server.port)
+        self.assertEqual(launcher.open_page_count(self.user_data.name), 0)
+
+    def test_nothing_listening(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertIsNone(self.endpoint.version())
+        self.assertFalse(self.endpoint.open_tab('https://example.com'))
+        self.assertIsNone(self.endpoint.page_count())
+
+
+class DevToolsPortTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'launcher.cfg')
+        self.config = launcher.ChromeLauncherConfig(self.path)
+
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            self.config.devtools_base_port = str(sock.getsockname()[1])
+
+    def test_ports_are_distinct_and_kept(self):
+        ports = [self.config.devtools_port_for('Stable', f'Profile {i}') for i in range(20)]
+        self.assertEqual(len(set(ports)), 20)
+        self.assertEqual(self.config.devtools_port_for('Stable', 'Profile 3'), ports[3])
+
+        # Same profile name in another channel's user data dir is another browser
+        self.assertNotIn(self.config.devtools_port_for('Beta', 'Profile 3'), ports)
+
+        reloaded = launcher.ChromeLauncherConfig(self.path)
+        reloaded.load()
+        self.assertEqual(reloaded.devtools_ports, self.config.devtools_ports)
+
+    def test_busy_port_is_skipped(self):
+        base = int(self.config.devtools_base_port)
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', base))
+            sock.listen(1)
+            self.assertNotEqual(self.config.devtools_port_for('Stable', 'Default'), base)
+
+
+@unittest.skipIf(not os.path.isdir('/proc'), 'needs /proc')
+class SoleProfileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.user_data = os.path.join(self.tmp.name, 'user-data')
+        os.mkdir(self.user_data)
+
+        # A stand-in browser: its argv[0] is named like Chrome
+        self.chrome = os.path.join(self.tmp.name, 'chrome')
+        os.symlink(sys.executable, self.chrome)
+
+    def start_browser(self, profile):
+        process = subprocess.Popen([self.chrome, '-c', 'import time; time.sleep(30)', f'--profile-directory={profile}'])
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+
+        # Until the exec completes, /proc shows no command line yet
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            with open(f'/proc/{process.pid}/cmdline', 'rb') as f:
+                if f'--profile-directory={profile}'.encode() in f.read():
+                    break
+            time.sleep(0.01)
+
+        os.symlink(f'{socket.gethostname()}-{process.pid}', os.path.join(self.user_data, 'SingletonLock'))
+        return process
+
+    def write_last_active(self, profiles):
+        with open(os.path.join(self.user_data, 'Local State'), 'w') as f:
+            json.dump({'profile': {'info_cache': {}, 'last_active_profiles': profiles}}, f)
+
+    def test_started_profile_alone(self):
+        self.start_browser('Profile 3')
+        detector = launcher.RunningProfileDetector(self.user_data, ttl=0)
+        self.assertEqual(detector.sole_profile(), 'Profile 3')
+
+    def test_other_profile_open_too(self):
+        self.start_browser('Profile 3')
+        self.write_last_active(['Profile 3', 'Profile 7'])
+        detector = launcher.RunningProfileDetector(self.user_data, ttl=0)
+        self.assertIsNone(detector.sole_profile())
+
+    def test_no_browser(self):
+        detector = launcher.RunningProfileDetector(self.user_data, ttl=0)
+        self.assertIsNone(detector.sole_profile())
+
+
+if __name__ == '__main__':
+    unittest.main()
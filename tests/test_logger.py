@@ -0,0 +1,57 @@
+"""Logger size-based rotation"""
+
+import glob
+import importlib.util
+import os
+import tempfile
+import unittest
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'chrome_launcher_ui_v2.2.py')
+
+spec = importlib.util.spec_from_file_location('chrome_launcher_ui', LAUNCHER)
+launcher = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(launcher)
+
+
+class RotationTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'launcher.log')
+
+    def files(self):
+        return glob.glob(self.path + '*')
+
+    def lines(self):
+        found = []
+        for path in self.files():
+            with open(path, encoding='utf-8') as f:
+                found.extend(f.read().splitlines())
+        return found
+
+    def check(self, logger):
+        for i in range(40):
+            logger.write(f'message {i:02d}')
+        logger.close()
+
+        for path in self.files():
+            self.assertLessEqual(os.path.getsize(path), 200, path)
+        self.assertEqual(sorted(line[-10:] for line in self.lines()), [f'message {i:02d}' for i in range(40)])
+
+    def test_unbuffered_files_stay_under_limit(self):
+        self.check(launcher.Logger(self.path, max_bytes=200, backups=20))
+
+    def test_batch_is_split_across_files(self):
+        # Batches flush once max_bytes have built up, so most straddle a rotation
+        self.check(launcher.Logger(self.path, buffered=True, max_bytes=200, backups=20, flush_interval=60))
+
+    def test_oversized_line_gets_a_file_of_its_own(self):
+        logger = launcher.Logger(self.path, max_bytes=50, backups=5)
+        logger.write('short')
+        logger.write('x' * 100)
+        logger.write('after')
+        self.assertEqual(len(self.files()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+"""EmailSearchIndex.rank candidate selection"""
+
+import importlib.util
+import os
+import unittest
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'chrome_launcher_ui_v2.2.py')
+
+spec = importlib.util.spec_from_file_location('chrome_launcher_ui', LAUNCHER)
+launcher = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(launcher)
+
+
+class RankTest(unittest.TestCase):
+    def setUp(self):
+        emails = ['k12@Gmail.com', 'Shop.X0013@gmail.com', 'ab0014@gmail.com', 'cd00120@gmail.com', 'team0012x9@gmail.com']
+        emails += [f'user{n:04d}@gmail.com' for n in range(1000, 1100)]
+        self.index = launcher.EmailSearchIndex(launcher.sort_emails_by_number(emails))
+
+    def test_plain_number_ranks_its_profile_first(self):
+        self.assertEqual(self.index.rank('12', {}, 5)[0], 'k12@Gmail.com')
+
+    def test_zero_padded_number_reaches_its_profile(self):
+        # It shares no trigram with '0012'; emails containing '0012' literally still lead
+        ranked = self.index.rank('0012', {}, 5)
+        self.assertEqual(ranked[0], 'team0012x9@gmail.com')
+        self.assertIn('k12@Gmail.com', ranked)
+        self.assertLess(ranked.index('k12@Gmail.com'), ranked.index('Shop.X0013@gmail.com'))
+
+    def test_prefix_beats_shared_grams_and_usage(self):
+        usage = {f'user{n:04d}@gmail.com': 100 for n in range(1000, 1100)}
+        self.assertEqual(self.index.rank('shop', usage, 1), ['Shop.X0013@gmail.com'])
+
+    def test_candidates_stay_bounded(self):
+        self.index.CANDIDATE_LIMIT = 3
+        self.assertIn('k12@Gmail.com', self.index.rank('0012', {}, 10))
+        self.assertLessEqual(len(self.index.rank('user', {}, 10)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""AutoUpdater.download_update against a local http.server stand-in"""
+
+import hashlib
+import http.server
+import importlib.util
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'chrome_launcher_ui_v2.2.py')
+
+spec = importlib.util.spec_from_file_location('chrome_launcher_ui', LAUNCHER)
+launcher = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(launcher)
+
+PAYLOAD = bytes(range(256)) * 1024  # 256 KB, several download chunks
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    """Serves self.body with an ETag and Range / If-Range support"""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.body = PAYLOAD
+        self.etag = '"v1"'
+        self.cut_after = 0  # > 0: close the connection after this many body bytes
+        self.force_416 = False
+        self.requests = []
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/chrome_launcher_ui_v2.2.py'
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        body = server.body
+
+        range_header = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if range_header and server.force_416:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{len(body)}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if range_header and (if_range is None or if_range == server.etag):
+            start = int(range_header[len('bytes='):].rstrip('-'))
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(body) - 1}/{len(body)}')
+            body = body[start:]
+        else:
+            self.send_response(200)
+
+        self.send_header('ETag', server.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        if server.cut_after:
+            self.wfile.write(body[:server.cut_after])
+            server.cut_after = 0
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class DownloadUpdateTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StandInServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.cache_home = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_home.cleanup)
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.cache_home.name, 'LOCALAPPDATA': self.cache_home.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.updater = launcher.AutoUpdater('1.0', '', self.server.url)
+        self.sha = hashlib.sha256(PAYLOAD).hexdigest()
+        self.part = self.updater.partial_download_path(self.server.url)
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_full_download_verified(self):
+        path = self.updater.download_update(self.server.url, self.sha)
+        self.assertEqual(self.read(path), PAYLOAD)
+        self.assertFalse(os.path.exists(path + '.json'))
+
+    @unittest.skipIf(not hasattr(os, 'getuid'), 'POSIX permissions')
+    def test_partial_dir_is_private(self):
+        mode = os.stat(os.path.dirname(self.part)).st_mode & 0o777
+        self.assertEqual(mode, 0o700)
+
+    def test_sha256_is_required(self):
+        self.assertIsNone(self.updater.download_update(self.server.url, ''))
+        self.assertIn('sha256', self.updater.last_error)
+        self.assertEqual(self.server.requests, [])
+
+    def test_checksum_mismatch_discards_file(self):
+        self.assertIsNone(self.updater.download_update(self.server.url, '0' * 64))
+        self.assertFalse(os.path.exists(self.part))
+
+    def test_interrupted_download_resumes_with_if_range(self):
+        self.server.cut_after = 100000
+        self.assertIsNone(self.updater.download_update(self.server.url, self.sha))
+        self.assertEqual(os.path.getsize(self.part), 100000)
+
+        path = self.updater.download_update(self.server.url, self.sha)
+        self.assertEqual(self.read(path), PAYLOAD)
+        resumed = self.server.requests[-1]
+        self.assertEqual(resumed.get('Range'), 'bytes=100000-')
+        self.assertEqual(resumed.get('If-Range'), '"v1"')
+
+    def test_changed_release_restarts_instead_of_splicing(self):
+        self.server.cut_after = 100000
+        self.updater.download_update(self.server.url, self.sha)
+
+        # Same URL, new file: If-Range no longer matches, server sends it whole
+        self.server.body = PAYLOAD[::-1]
+        self.server.etag = '"v2"'
+        path = self.updater.download_update(self.server.url, self.sha)
+        self.assertIsNone(path)
+        self.assertIn('Checksum', self.updater.last_error)
+
+        new_sha = hashlib.sha256(self.server.body).hexdigest()
+        path = self.updater.download_update(self.server.url, new_sha)
+        self.assertEqual(self.read(path), self.server.body)
+
+    def test_planted_partial_file_is_not_trusted(self):
+        with open(self.part, 'wb') as f:
+            f.write(PAYLOAD)
+        path = self.updater.download_update(self.server.url, self.sha)
+        self.assertEqual(self.read(path), PAYLOAD)
+        self.assertNotIn('Range', self.server.requests[-1])
+
+        with open(self.part, 'wb') as f:
+            f.write(b'evil' * 1000)
+        path = self.updater.download_update(self.server.url, self.sha)
+        self.assertEqual(self.read(path), PAYLOAD)
+
+    def test_416_refetches_whole_file(self):
+        self.server.cut_after = 100000
+        self.updater.download_update(self.server.url, self.sha)
+
+        self.server.force_416 = True
+        path = self.updater.download_update(self.server.url, self.sha)
+        self.assertEqual(self.read(path), PAYLOAD)
+        self.assertNotIn('Range', self.server.requests[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()